@@ -6,4 +6,5 @@ class AccountsConfig(AppConfig):
 
     def ready(self):
         # This imports the signals when the app starts up so they start listening
-        import accounts.signals
\ No newline at end of file
+        import accounts.signals
+        import accounts.checks
\ No newline at end of file
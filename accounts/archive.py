@@ -0,0 +1,120 @@
+"""
+Hot/cold split of accounts.User.
+
+Long-inactive users are moved into ArchivedUser: their User row becomes a
+small inactive stub (email, role, dates) and everything else is copied to the
+archive. Hot queries filter ``is_archived=False`` and are served by partial
+indexes that leave the stubs out. A successful login or a confirmed password
+reset restores the user transparently.
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import ArchivedUser
+
+User = get_user_model()
+
+# Columns blanked on the stub; their values move into ArchivedUser.data.
+ARCHIVED_DATA_FIELDS = ("password", "phone", "is_active", "is_staff")
+
+
+def archive_candidates(months):
+    """Users with no login (or, if never logged in, no signup) for ``months``."""
+    cutoff = timezone.now() - timedelta(days=months * 30)
+    return (
+        User.objects.hot()
+        .filter(is_superuser=False)
+        .exclude(role="ADMIN")
+        .filter(
+            Q(last_login__lt=cutoff)
+            | Q(last_login__isnull=True, date_joined__lt=cutoff)
+        )
+    )
+
+
+def archive_users(candidates, limit=None):
+    """
+    Archive up to ``limit`` users of the ``candidates`` queryset in one
+    transaction; returns how many were archived.
+
+    The batch is selected under a row lock (skipping rows a request holds),
+    and the UPDATE re-applies the candidate filter, so a user who logs in
+    meanwhile stays hot and keeps their session.
+    """
+    with transaction.atomic():
+        batch = candidates.hot().order_by("pk").select_for_update(skip_locked=True)
+        if limit is not None:
+            batch = batch[:limit]
+        users = {user.pk: user for user in batch}
+        if not users:
+            return 0
+
+        candidates.hot().filter(pk__in=users).update(
+            is_archived=True,
+            first_name="",
+            last_name="",
+            phone=None,
+            # "!" marks an unusable password; the real hash is in the archive.
+            password="!",
+            is_active=False,
+            is_staff=False,
+        )
+        # Rows this UPDATE changed are archived but have no archive row yet.
+        archived_ids = list(
+            User.objects.filter(
+                pk__in=users, is_archived=True, archive__isnull=True
+            ).values_list("pk", flat=True)
+        )
+        ArchivedUser.objects.bulk_create(
+            ArchivedUser(
+                user_id=pk,
+                first_name=users[pk].first_name,
+                last_name=users[pk].last_name,
+                data={
+                    field: getattr(users[pk], field) for field in ARCHIVED_DATA_FIELDS
+                },
+            )
+            for pk in archived_ids
+        )
+    return len(archived_ids)
+
+
+def restore_user(user, password=None):
+    """
+    Move an archived user back into the hot table and return it.
+
+    When ``password`` is given the user is only restored if it matches the
+    archived hash, so failed logins never wake an account up.
+    """
+    with transaction.atomic():
+        try:
+            archive = ArchivedUser.objects.select_for_update().get(user=user)
+        except ArchivedUser.DoesNotExist:
+            return user
+        if password is not None and not check_password(
+            password, archive.data["password"]
+        ):
+            return user
+
+        user.first_name = archive.first_name
+        user.last_name = archive.last_name
+        for field in ARCHIVED_DATA_FIELDS:
+            setattr(user, field, archive.data[field])
+        user.is_archived = False
+        user.save(
+            update_fields=[
+                "first_name",
+                "last_name",
+                "is_archived",
+                *ARCHIVED_DATA_FIELDS,
+            ]
+        )
+        archive.delete()
+    return user
+
@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from .archive import restore_user
+
+UserModel = get_user_model()
+
+
+class ArchiveAwareBackend(ModelBackend):
+    """
+    ModelBackend that restores archived users on a successful login. The
+    natural-key lookup finds the stub row, so hot users pay no extra query.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user.
+            UserModel().set_password(password)
+            return None
+
+        if user.is_archived:
+            user = restore_user(user, password=password)
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
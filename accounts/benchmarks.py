@@ -0,0 +1,232 @@
+"""
+Micro-benchmarks for the auth and user-management flows.
+
+Each case performs one iteration against the Django test client and returns
+the response (or the rendered payload). ``run_benchmarks`` times the cases and
+is driven by the ``bench`` management command, which owns database setup and
+result storage.
+"""
+
+import itertools
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .factories import BENCH_EMAIL_TEMPLATE, BENCH_PASSWORD
+from .utils import build_html_email
+
+User = get_user_model()
+
+BENCHMARKS = []
+
+
+def benchmark(name, repeat=None):
+    """Register a benchmark case. ``repeat`` caps the iterations for slow cases."""
+
+    def decorator(func):
+        BENCHMARKS.append((name, func, repeat))
+        return func
+
+    return decorator
+
+
+class BenchContext:
+    """Shared state for one benchmark run (clients, counters, seeded users)."""
+
+    def __init__(self, user_count):
+        self.user_count = user_count
+        self.admin = User.objects.filter(role="ADMIN", is_active=True).first()
+        if self.admin is None:
+            self.admin = User.objects.create_superuser(
+                email="bench-admin@example.com", password=BENCH_PASSWORD
+            )
+        self.admin_client = Client()
+        self.admin_client.force_login(self.admin)
+        self.sequence = itertools.count()
+
+    def get(self, client, url, data=None, htmx=False, encoding="identity"):
+        headers = {"Accept-Encoding": encoding}
+        if htmx:
+            headers["HX-Request"] = "true"
+        return client.get(url, data, secure=True, headers=headers)
+
+    def post(self, client, url, data):
+        return client.post(url, data, secure=True)
+
+
+def _payload_size(result):
+    if hasattr(result, "streaming_content"):
+        return sum(len(chunk) for chunk in result.streaming_content)
+    if hasattr(result, "content"):
+        return len(result.content)
+    return len(result)
+
+
+def run_case(ctx, func, repeat):
+    """Time ``repeat`` iterations of ``func`` after one untimed warm-up."""
+    func(ctx)
+    timings = []
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        func(ctx)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # The last iteration also records queries and payload size.
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        result = func(ctx)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "runs": len(timings),
+        "min_ms": round(timings[0], 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[max(0, int(len(timings) * 0.95) - 1)], 3),
+        "queries": len(queries),
+        "bytes": _payload_size(result),
+    }
+
+
+def run_benchmarks(ctx, repeat=20, only=None, stdout=None):
+    results = {}
+    for name, func, case_repeat in BENCHMARKS:
+        if only and only not in name:
+            continue
+        results[name] = run_case(ctx, func, min(repeat, case_repeat or repeat))
+        if stdout is not None:
+            r = results[name]
+            stdout.write(
+                f"  {name:<36} median {r['median_ms']:>9.2f} ms  "
+                f"p95 {r['p95_ms']:>9.2f} ms  {r['queries']:>3} q  {r['bytes']:>8} B"
+            )
+    return results
+
+
+# --- MANAGE USERS ---
+@benchmark("manage_users.first_page")
+def manage_users_first_page(ctx):
+    return ctx.get(ctx.admin_client, reverse("accounts:manage_users"))
+
+
+@benchmark("manage_users.search")
+def manage_users_search(ctx):
+    return ctx.get(
+        ctx.admin_client, reverse("accounts:manage_users"), {"q": "smith"}, htmx=True
+    )
+
+
+@benchmark("manage_users.role_filter")
+def manage_users_role_filter(ctx):
+    return ctx.get(
+        ctx.admin_client,
+        reverse("accounts:manage_users"),
+        {"role": "MANAGER"},
+        htmx=True,
+    )
+
+
+@benchmark("manage_users.deep_page")
+def manage_users_deep_page(ctx):
+    return ctx.get(
+        ctx.admin_client, reverse("accounts:manage_users"), {"page": "last"}, htmx=True
+    )
+
+
+def _page_size_case(per_page):
+    def case(ctx):
+        with override_settings(USERS_PER_PAGE=per_page):
+            return ctx.get(
+                ctx.admin_client, reverse("accounts:manage_users"), htmx=True
+            )
+
+    return case
+
+
+for _per_page in (10, 25, 50, 100):
+    benchmark(f"manage_users.rows_per_page_{_per_page}")(_page_size_case(_per_page))
+
+
+# --- AUTH FLOWS ---
+# Password hashing dominates these, so they run fewer iterations.
+@benchmark("auth.login", repeat=10)
+def login(ctx):
+    return ctx.post(
+        Client(),
+        reverse("accounts:login"),
+        {
+            "username": BENCH_EMAIL_TEMPLATE.format(n=0),
+            "password": BENCH_PASSWORD,
+        },
+    )
+
+
+@benchmark("auth.register", repeat=10)
+def register(ctx):
+    n = next(ctx.sequence)
+    return ctx.post(
+        Client(),
+        reverse("accounts:register"),
+        {
+            "first_name": "Bench",
+            "last_name": "Register",
+            "email": f"bench-register-{time.time_ns()}-{n}@example.com",
+            "password1": "Sup3r-secret-pass",
+            "password2": "Sup3r-secret-pass",
+        },
+    )
+
+
+@benchmark("auth.password_reset")
+def password_reset(ctx):
+    # A fresh address each time; repeats would hit the dedup short-circuit.
+    n = next(ctx.sequence) % ctx.user_count
+    return ctx.post(
+        Client(),
+        reverse("accounts:password_reset"),
+        {"email": BENCH_EMAIL_TEMPLATE.format(n=n)},
+    )
+
+
+# --- EMAIL RENDERING ---
+@benchmark("email.render_welcome")
+def render_welcome(ctx):
+    message = build_html_email(
+        subject="Welcome to Starter Kit",
+        template_name="emails/welcome.html",
+        context={"user": ctx.admin},
+        recipient_list=[ctx.admin.email],
+    )
+    return message.message().as_bytes()
+
+
+# --- REPORTS ---
+@benchmark("reports.users_by_role_csv_gzip", repeat=5)
+def report_users_by_role(ctx):
+    response = ctx.admin_client.get(
+        reverse("accounts:user_report", args=["users-by-role"]),
+        secure=True,
+        headers={"Accept-Encoding": "gzip"},
+    )
+    # Consume the stream inside the timed iteration.
+    return b"".join(response.streaming_content)
+
+
+# --- RESPONSE COMPRESSION ---
+# Bytes on the wire per encoding; the median difference against "identity"
+# is the CPU the compression middleware adds to each response.
+def _dashboard_case(encoding):
+    def case(ctx):
+        return ctx.get(ctx.admin_client, reverse("dashboard"), encoding=encoding)
+
+    return case
+
+
+# HTML is never sent as Brotli (see main.middleware.BROTLI_TYPES).
+for _encoding in ("identity", "gzip"):
+    benchmark(f"compression.dashboard_{_encoding}")(_dashboard_case(_encoding))
@@ -0,0 +1,57 @@
+from django.core.checks import Error, Tags, register
+from django.db.models import F
+
+from .models import ArchivedUser, User
+
+SENSITIVE_FIELDS = {"password"}
+
+
+def listing_querysets():
+    """The querysets that back list endpoints, as the views build them."""
+    from .reports import REPORTS
+
+    yield "manage_users", User.objects.hot().listing_rows()
+    yield "manage_users (archived)", ArchivedUser.objects.listing_rows()
+    for name, report in REPORTS.items():
+        yield f"report {name}", report({})[1]
+
+
+def selected_fields(query):
+    """Names of the concrete fields a compiled ``query`` would read."""
+    if query.combinator:
+        return set().union(*(selected_fields(q) for q in query.combined_queries))
+
+    if query.values_select or query.annotation_select:
+        names = set(query.values_select)
+        for annotation in query.annotation_select.values():
+            for expr in annotation.flatten():
+                if isinstance(expr, F):
+                    names.add(expr.name.rsplit("__", 1)[-1])
+                target = getattr(expr, "target", None)
+                if target is not None:
+                    names.add(target.name)
+        return names
+
+    concrete = {field.name for field in query.model._meta.concrete_fields}
+    fields, defer = query.deferred_loading
+    if defer:
+        return concrete - set(fields)
+    return set(fields) | {query.model._meta.pk.name}
+
+
+@register(Tags.models)
+def check_listing_fields(app_configs, **kwargs):
+    """List endpoints must never select the password hash."""
+    errors = []
+    for label, queryset in listing_querysets():
+        leaked = selected_fields(queryset.query) & SENSITIVE_FIELDS
+        if leaked:
+            errors.append(
+                Error(
+                    f"The {label} listing selects {', '.join(sorted(leaked))}.",
+                    hint="Listing views only render display columns; drop the hash.",
+                    obj=User,
+                    id="accounts.E001",
+                )
+            )
+    return errors
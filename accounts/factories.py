@@ -0,0 +1,71 @@
+"""Bulk data factories used by the seed_users and bench commands."""
+
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+User = get_user_model()
+
+BENCH_PASSWORD = "bench-pass-123"
+BENCH_EMAIL_TEMPLATE = "bench-user-{n}@example.com"
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Claire", "David", "Esther", "Frank", "Grace", "Henri",
+    "Irene", "James", "Keza", "Louis", "Marie", "Noah", "Olive", "Paul",
+]
+LAST_NAMES = [
+    "Smith", "Mugisha", "Dupont", "Keller", "Uwase", "Garcia", "Ndayisaba",
+    "Martin", "Brown", "Habimana", "Rossi", "Kim", "Ingabire", "Silva",
+]
+# Roughly what a real deployment looks like: a handful of admins.
+ROLE_WEIGHTS = [("ADMIN", 1), ("MANAGER", 9), ("DEFAULT", 90)]
+
+
+def seed_users(count, batch_size=5000, start=0, days=3 * 365, seed=42, stdout=None):
+    """
+    Insert ``count`` users in batches and return how many were created.
+
+    Every user shares one precomputed password hash (hashing per row would
+    dominate the run) and signup dates are spread over the last ``days``.
+    Emails follow BENCH_EMAIL_TEMPLATE starting at index ``start``, so
+    repeated runs can append instead of colliding.
+    """
+    rng = random.Random(seed)
+    password = make_password(BENCH_PASSWORD)
+    roles, weights = zip(*ROLE_WEIGHTS)
+    now = timezone.now()
+
+    created = 0
+    while created < count:
+        size = min(batch_size, count - created)
+        batch = []
+        for n in range(start + created, start + created + size):
+            batch.append(
+                User(
+                    email=BENCH_EMAIL_TEMPLATE.format(n=n),
+                    password=password,
+                    first_name=rng.choice(FIRST_NAMES),
+                    last_name=rng.choice(LAST_NAMES),
+                    role=rng.choices(roles, weights)[0],
+                    # The first few accounts are always active so the login
+                    # and password-reset benchmarks have a known target.
+                    is_active=n < 10 or rng.random() > 0.05,
+                )
+            )
+        batch = User.objects.bulk_create(batch)
+
+        # date_joined is auto_now_add, so bulk_create stamps "now"; backdate it
+        # afterwards (bulk_update does not run pre_save). Seeded accounts are
+        # verified at signup so purge_unverified_users leaves them alone.
+        for user in batch:
+            user.date_joined = now - timedelta(seconds=rng.randint(0, days * 86400))
+            user.email_verified_at = user.date_joined
+        User.objects.bulk_update(batch, ["date_joined", "email_verified_at"])
+
+        created += size
+        if stdout is not None:
+            stdout.write(f"  seeded {created}/{count} users")
+    return created
@@ -2,12 +2,20 @@ from django import forms
 from django.contrib.auth.forms import (
     UserCreationForm,
     PasswordResetForm,
+    SetPasswordForm,
     PasswordChangeForm as DjangoPasswordChangeForm,
 )
+from django.conf import settings
+from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
-import threading
+import hashlib
+import logging
+from .archive import restore_user
 from .models import User
+from .utils import email_queue
+
+logger = logging.getLogger(__name__)
 
 
 class BootstrapFormMixin:
@@ -24,7 +32,25 @@ class BootstrapFormMixin:
                 field.widget.attrs["class"] = "form-control"
 
 
-class RegistrationForm(BootstrapFormMixin, UserCreationForm):
+class UniqueEmailMixin:
+    """
+    Reports a case-insensitive email clash on the ``email`` field. Left to the
+    model, the Lower(email) constraint surfaces as a form-wide error.
+    """
+
+    def clean_email(self):
+        email = self.cleaned_data["email"]
+        clashes = User.objects.by_email(email)
+        if self.instance.pk:
+            clashes = clashes.exclude(pk=self.instance.pk)
+        if clashes.exists():
+            raise forms.ValidationError(
+                "A user with this email already exists.", code="unique"
+            )
+        return email
+
+
+class RegistrationForm(BootstrapFormMixin, UniqueEmailMixin, UserCreationForm):
     """Used on the public /register/ page."""
 
     email = forms.EmailField(
@@ -45,7 +71,7 @@ class RegistrationForm(BootstrapFormMixin, UserCreationForm):
         self.fields["password2"].help_text = "Enter the same password again."
 
 
-class AdminUserManagementForm(BootstrapFormMixin, forms.ModelForm):
+class AdminUserManagementForm(BootstrapFormMixin, UniqueEmailMixin, forms.ModelForm):
     """Used by admins to edit users (and create users via the manual password logic in views)."""
 
     class Meta:
@@ -56,7 +82,7 @@ class AdminUserManagementForm(BootstrapFormMixin, forms.ModelForm):
         }
 
 
-class UserProfileForm(BootstrapFormMixin, forms.ModelForm):
+class UserProfileForm(BootstrapFormMixin, UniqueEmailMixin, forms.ModelForm):
     """Used by authenticated users to edit their own profile (excludes role/status)."""
 
     class Meta:
@@ -73,12 +99,44 @@ class PasswordChangeForm(BootstrapFormMixin, DjangoPasswordChangeForm):
     pass
 
 
+class ArchiveRestoringSetPasswordForm(SetPasswordForm):
+    """
+    Password reset confirmation that first restores an archived account, now
+    that its owner has proven access to the mailbox.
+    """
+
+    def save(self, commit=True):
+        if self.user.is_archived:
+            self.user = restore_user(self.user)
+        return super().save(commit)
+
+
 class AsyncPasswordResetForm(BootstrapFormMixin, PasswordResetForm):
     """
-    Overrides Django's default PasswordResetForm to send the
-    reset email in a background thread, preventing server timeouts.
+    Overrides Django's default PasswordResetForm so the request only generates
+    the token: rendering and sending run on the background email queue, and
+    repeated requests for the same address within the dedup window are dropped.
     """
 
+    def save(self, *args, **kwargs):
+        email = self.cleaned_data["email"]
+        digest = hashlib.sha256(email.lower().encode()).hexdigest()
+        self.dedup_key = f"password-reset:{digest}"
+        if not cache.add(self.dedup_key, True, settings.PASSWORD_RESET_DEDUP_SECONDS):
+            email_queue.incr("password_reset.deduplicated")
+            logger.info("Password reset deduplicated kind=password_reset")
+            return
+        super().save(*args, **kwargs)
+
+    def get_users(self, email):
+        yield from super().get_users(email)
+        # Archived stubs are inactive with an unusable password, so Django
+        # skips them. They still get the link, but nothing is restored until
+        # the reset is confirmed (see ArchiveRestoringSetPasswordForm).
+        yield from User.objects.by_email(email).filter(
+            is_archived=True, archive__data__is_active=True
+        )
+
     def send_mail(
         self,
         subject_template_name,
@@ -88,31 +146,29 @@ class AsyncPasswordResetForm(BootstrapFormMixin, PasswordResetForm):
         to_email,
         html_email_template_name=None,
     ):
-
-        # 1. Render the subject and body
-        subject = render_to_string(subject_template_name, context)
-        subject = "".join(subject.splitlines())  # Remove newlines from subject
-        body = render_to_string(email_template_name, context)
-
-        # 2. Build the email message
-        email_message = EmailMultiAlternatives(subject, body, from_email, [to_email])
-        if html_email_template_name is not None:
-            html_email = render_to_string(html_email_template_name, context)
-            email_message.attach_alternative(html_email, "text/html")
-
-        # 3. Send it in a background thread
-        class EmailThread(threading.Thread):
-            def __init__(self, email):
-                self.email = email
-                threading.Thread.__init__(self)
-
-            def run(self):
-                try:
-                    # CHANGED: fail_silently is now False so it raises the error
-                    self.email.send(fail_silently=False)
-                    print(f"SUCCESS: Email sent to {self.email.to}")
-                except Exception as e:
-                    # This will print the exact reason it failed to your Render logs!
-                    print(f"EMAIL FAILED: {str(e)}")
-
-        EmailThread(email_message).start()
+        user = context["user"]
+        if user.is_archived:
+            # Greet by the archived name; the stub's own is blank. The
+            # instance is only used for rendering and is never saved.
+            user.first_name = user.archive.first_name
+
+        # Django's implementation renders and sends inline; defer both to the
+        # background email queue instead.
+        def build_message():
+            subject = render_to_string(subject_template_name, context)
+            subject = "".join(subject.splitlines())  # Remove newlines from subject
+            body = render_to_string(email_template_name, context)
+
+            email_message = EmailMultiAlternatives(subject, body, from_email, [to_email])
+            if html_email_template_name is not None:
+                html_email = render_to_string(html_email_template_name, context)
+                email_message.attach_alternative(html_email, "text/html")
+            return email_message
+
+        # A failed delivery must not block the address for the dedup window.
+        dedup_key = self.dedup_key
+        email_queue.put(
+            "password_reset",
+            build_message,
+            on_failure=lambda: cache.delete(dedup_key),
+        )
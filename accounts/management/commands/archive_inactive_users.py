@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.archive import archive_candidates, archive_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Move users with no login for --months into the archive table in "
+        "bounded batches. They are restored when they log in again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months", type=int, default=12)
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to pause between batches to spread the load.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        candidates = archive_candidates(options["months"])
+        total = candidates.count()
+
+        if options["dry_run"] or not total:
+            self.stdout.write(f"{total} inactive users to archive.")
+            return
+
+        archived = 0
+        while True:
+            # Archived rows drop out of the candidate set, so always take the
+            # first batch; each batch runs in its own short transaction.
+            count = archive_users(candidates, limit=options["batch_size"])
+            if not count:
+                break
+            archived += count
+            self.stdout.write(f"  archived {archived}/{total} users")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} users."))
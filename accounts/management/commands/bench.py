@@ -0,0 +1,123 @@
+import json
+import platform
+import subprocess
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from accounts.benchmarks import BenchContext, run_benchmarks
+from accounts.factories import seed_users
+
+User = get_user_model()
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the benchmark suite against a throwaway test database and store "
+        "the results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=10_000, help="Users to seed (10k-1M)."
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--only", help="Only run cases whose name contains this.")
+        parser.add_argument(
+            "--output-dir", default=str(settings.BASE_DIR / "bench_results")
+        )
+        parser.add_argument(
+            "--compare", help="Previous results file to diff the medians against."
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Reuse the test database (and its seeded users) between runs.",
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, keepdb=options["keepdb"]
+        )
+        try:
+            existing = User.objects.count()
+            if existing < options["users"]:
+                self.stdout.write(f"Seeding {options['users'] - existing} users...")
+                seed_users(
+                    options["users"] - existing, start=existing, stdout=self.stdout
+                )
+
+            self.stdout.write(self.style.MIGRATE_HEADING("Running benchmarks"))
+            ctx = BenchContext(options["users"])
+            results = run_benchmarks(
+                ctx,
+                repeat=options["repeat"],
+                only=options["only"],
+                stdout=self.stdout,
+            )
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=options["keepdb"]
+            )
+            teardown_test_environment()
+
+        revision = git_revision()
+        report = {
+            "meta": {
+                "revision": revision,
+                "timestamp": timezone.now().isoformat(),
+                "database": connection.vendor,
+                "users": options["users"],
+                "repeat": options["repeat"],
+                "python": platform.python_version(),
+            },
+            "results": results,
+        }
+
+        output_dir = Path(options["output_dir"])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = timezone.now().strftime("%Y%m%d-%H%M%S")
+        path = output_dir / f"{stamp}-{revision}.json"
+        path.write_text(json.dumps(report, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Results written to {path}"))
+
+        if options["compare"]:
+            self.compare(results, json.loads(Path(options["compare"]).read_text()))
+
+    def compare(self, results, previous):
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"Compared with {previous['meta'].get('revision', '?')}"
+            )
+        )
+        for name, current in results.items():
+            before = previous["results"].get(name)
+            if not before:
+                continue
+            delta = (current["median_ms"] - before["median_ms"]) / before["median_ms"]
+            style = self.style.ERROR if delta > 0.10 else self.style.SUCCESS
+            self.stdout.write(
+                style(
+                    f"  {name:<36} {before['median_ms']:>9.2f} -> "
+                    f"{current['median_ms']:>9.2f} ms ({delta:+.1%})"
+                )
+            )
@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count
+
+User = get_user_model()
+
+
+def hot_queries():
+    """The queries issued on every login and user-management page load."""
+    hot = User.objects.hot()
+    listing = hot.order_by("-date_joined").listing_rows()
+    return {
+        "login lookup": User.objects.by_email("someone@example.com"),
+        "manage_users: first page": listing[:10],
+        "manage_users: role filter": hot.filter(role="MANAGER")
+        .order_by("-date_joined")
+        .listing_rows()[:10],
+        "manage_users: search": hot.search("smith")
+        .order_by("-date_joined")
+        .listing_rows()[:10],
+        "manage_users: deep page": listing[10000:10010],
+        "manage_users: counts": hot.values("role").annotate(n=Count("id")),
+        "active users by signup date": hot.filter(is_active=True)
+        .order_by("-date_joined")
+        .listing_rows()[:10],
+    }
+
+
+class Command(BaseCommand):
+    help = "Print EXPLAIN plans for the known hot queries on accounts.User."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN ANALYZE (PostgreSQL only; executes the queries).",
+        )
+        parser.add_argument(
+            "--only",
+            help="Only explain queries whose label contains this text.",
+        )
+
+    def handle(self, *args, **options):
+        explain_options = {}
+        if options["analyze"] and connection.vendor == "postgresql":
+            explain_options = {"analyze": True, "buffers": True}
+
+        for label, queryset in hot_queries().items():
+            if options["only"] and options["only"].lower() not in label.lower():
+                continue
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(str(queryset.query))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write("")
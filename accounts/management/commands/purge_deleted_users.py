@@ -0,0 +1,63 @@
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+User = get_user_model()
+
+class Command(BaseCommand):
+    help = (
+        "Hard-delete soft-deleted users and their related rows in bounded "
+        "batches, then clear expired sessions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--grace-days",
+            type=int,
+            default=0,
+            help="Only purge users soft-deleted at least this many days ago.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to pause between batches to spread the load.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["grace_days"])
+        pending = User.all_objects.filter(deleted_at__lte=cutoff)
+        total = pending.count()
+
+        if options["dry_run"] or not total:
+            self.stdout.write(f"{total} soft-deleted users to purge.")
+            return
+
+        purged = 0
+        batch_size = options["batch_size"]
+        while True:
+            ids = list(pending.order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            # One short transaction per batch keeps locks bounded; the collector
+            # removes the groups/user_permissions rows for the whole batch.
+            with transaction.atomic():
+                User.all_objects.filter(pk__in=ids).delete()
+            purged += len(ids)
+            self.stdout.write(f"  purged {purged}/{total} users")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        # Sessions are not scanned per user: soft-deleted and purged users
+        # already fail the session's user lookup, so their sessions are dead
+        # and expire like any other. clearsessions removes expired rows with
+        # one DELETE on the indexed expire_date.
+        call_command("clearsessions")
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} users."))
@@ -0,0 +1,61 @@
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove accounts that never verified their email address. By default "
+        "they are soft-deleted (purge_deleted_users finishes the job); --hard "
+        "deletes them outright."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Only accounts that signed up at least this many days ago.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--sleep", type=float, default=0)
+        parser.add_argument("--hard", action="store_true")
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        # Admin-activated accounts are kept even if never verified.
+        pending = User.objects.filter(
+            email_verified_at__isnull=True, is_active=False, date_joined__lt=cutoff
+        )
+        total = pending.count()
+        if options["dry_run"] or not total:
+            self.stdout.write(f"{total} unverified accounts older than {options['days']} days.")
+            return
+
+        done = 0
+        while True:
+            ids = list(
+                pending.order_by("pk").values_list("pk", flat=True)[: options["batch_size"]]
+            )
+            if not ids:
+                break
+            batch = User.all_objects.filter(pk__in=ids)
+            with transaction.atomic():
+                if options["hard"]:
+                    batch.delete()
+                else:
+                    batch.soft_delete()
+            done += len(ids)
+            self.stdout.write(f"  processed {done}/{total} accounts")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        action = "Deleted" if options["hard"] else "Soft-deleted"
+        self.stdout.write(self.style.SUCCESS(f"{action} {done} unverified accounts."))
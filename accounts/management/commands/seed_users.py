@@ -0,0 +1,70 @@
+import os
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.factories import BENCH_EMAIL_TEMPLATE, BENCH_PASSWORD, seed_users
+
+User = get_user_model()
+
+BENCH_ADMIN_EMAIL = "bench-admin@example.com"
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed the database with synthetic users for benchmarks and load tests. "
+        "Refuses to run with DEBUG off unless --create-admin is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=10_000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--create-admin",
+            action="store_true",
+            help=(
+                f"Also create the {BENCH_ADMIN_EMAIL} superuser used by the load "
+                "test's admin scenario. Required to seed with DEBUG off."
+            ),
+        )
+        parser.add_argument(
+            "--admin-password",
+            default=os.environ.get("BENCH_ADMIN_PASSWORD", ""),
+            help="Password for the bench admin (default: $BENCH_ADMIN_PASSWORD).",
+        )
+
+    def handle(self, *args, **options):
+        if not (settings.DEBUG or options["create_admin"]):
+            raise CommandError(
+                "seed_users creates accounts with a published password; it only "
+                "runs with DEBUG on, or with --create-admin to confirm the target."
+            )
+        if options["create_admin"] and not options["admin_password"]:
+            raise CommandError(
+                "--create-admin needs --admin-password or BENCH_ADMIN_PASSWORD."
+            )
+
+        # Continue numbering after any previously seeded bench users.
+        start = User.objects.filter(email__startswith="bench-user-").count()
+        created = seed_users(
+            options["count"],
+            batch_size=options["batch_size"],
+            start=start,
+            stdout=self.stdout,
+        )
+        # Login target for the admin scenario in loadtest/locustfile.py
+        if options["create_admin"] and not User.objects.filter(
+            email=BENCH_ADMIN_EMAIL
+        ).exists():
+            User.objects.create_superuser(
+                email=BENCH_ADMIN_EMAIL, password=options["admin_password"]
+            )
+            self.stdout.write(f"Created superuser {BENCH_ADMIN_EMAIL}.")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {created} users "
+                f"({BENCH_EMAIL_TEMPLATE.format(n=start)}, ... / {BENCH_PASSWORD})."
+            )
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.2 on 2026-10-19 11:30
+
+from django.db import migrations, models
+
+
+def mark_existing_users_verified(apps, schema_editor):
+    # Accounts created before verification existed are trusted as-is.
+    User = apps.get_model('accounts', 'User')
+    User._base_manager.filter(email_verified_at__isnull=True).update(
+        email_verified_at=models.F('date_joined')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_soft_delete'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='email_verified_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(mark_existing_users_verified, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('email_verified_at__isnull', True)), fields=['date_joined'], name='user_unverified_idx'),
+        ),
+    ]
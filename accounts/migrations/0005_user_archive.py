@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-19 12:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_email_verified_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedUser',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='archive', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('first_name', models.CharField(blank=True, max_length=150)),
+                ('last_name', models.CharField(blank=True, max_length=150)),
+                ('data', models.JSONField(default=dict)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archived user',
+                'verbose_name_plural': 'Archived users',
+            },
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='is_archived',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.2 on 2026-10-19 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_user_archive'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        # Build the partial indexes before dropping the full ones they replace.
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['-date_joined'], name='user_hot_joined_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['role', '-date_joined'], name='user_hot_role_joined_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_joined_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_role_joined_idx',
+        ),
+    ]
@@ -1,10 +1,66 @@
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.db.models.functions import Cast, Concat, Lower
+from django.db.models.lookups import Exact
+from django.utils import timezone
 
+# Columns rendered by the user management table. ``password`` must never be
+# part of a listing projection; accounts.E001 checks the listing querysets.
+LISTING_FIELDS = (
+    "id",
+    "first_name",
+    "last_name",
+    "email",
+    "role",
+    "is_active",
+    "date_joined",
+)
 
-class UserManager(BaseUserManager):
+
+class UserQuerySet(models.QuerySet):
+    """Query helpers for listings, lookups and bulk maintenance of users."""
+
+    def listing_rows(self):
+        """Lightweight named tuples for the HTMX table (no model instances)."""
+        return self.values_list(*LISTING_FIELDS, named=True)
+
+    def hot(self):
+        """Users whose details have not been moved to the archive table."""
+        return self.filter(is_archived=False)
+
+    def by_email(self, email):
+        """Case-insensitive email match that is served by the Lower(email) index."""
+        return self.filter(Exact(Lower("email"), email.lower()))
+
+    def soft_delete(self):
+        """Bulk version of ``User.soft_delete``; returns the number of rows."""
+        return self.update(
+            deleted_at=timezone.now(),
+            is_active=False,
+            email=Concat(
+                models.Value("deleted-"),
+                Cast("pk", models.CharField()),
+                models.Value("@deleted.invalid"),
+            ),
+        )
+
+    def search(self, query):
+        if not query:
+            return self
+        return self.filter(
+            models.Q(first_name__icontains=query)
+            | models.Q(last_name__icontains=query)
+            | models.Q(email__icontains=query)
+        )
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """Define a model manager for User model with no username field."""
 
+    def get_queryset(self):
+        # Soft-deleted users are invisible everywhere except User.all_objects.
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
     def create_user(self, email, password=None, **extra_fields):
         if not email:
             raise ValueError("The Email field must be set")
@@ -18,8 +74,12 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault("is_staff", True)
         extra_fields.setdefault("is_superuser", True)
         extra_fields.setdefault("role", "ADMIN")
+        extra_fields.setdefault("email_verified_at", timezone.now())
         return self.create_user(email, password, **extra_fields)
 
+    def get_by_natural_key(self, username):
+        return self.by_email(username).get()
+
 
 class User(AbstractUser):
     ROLE_CHOICES = [
@@ -36,6 +96,11 @@ class User(AbstractUser):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(auto_now_add=True)
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+    email_verified_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # Archived users are stubs: the row keeps email, role and dates, the rest
+    # lives in ArchivedUser until the user comes back.
+    is_archived = models.BooleanField(default=False, editable=False)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = [
@@ -44,15 +109,65 @@ class User(AbstractUser):
     ]  # Email & Password are required by default
 
     objects = UserManager()
+    # Includes soft-deleted users; used by the purge_deleted_users command.
+    all_objects = models.Manager.from_queryset(UserQuerySet)()
 
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
-        ordering = ["first_name", "last_name"]
+        # No default ordering: list views order explicitly, and an implicit
+        # ORDER BY first_name, last_name forced a sort on every other query.
+        indexes = [
+            # The listing and count paths only read hot users, so their
+            # indexes leave archived stubs out.
+            models.Index(
+                fields=["-date_joined"],
+                name="user_hot_joined_idx",
+                condition=models.Q(is_archived=False),
+            ),
+            models.Index(
+                fields=["role", "-date_joined"],
+                name="user_hot_role_joined_idx",
+                condition=models.Q(is_archived=False),
+            ),
+            models.Index(
+                fields=["-date_joined"],
+                name="user_active_joined_idx",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["date_joined"],
+                name="user_unverified_idx",
+                condition=models.Q(email_verified_at__isnull=True),
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                name="user_deleted_idx",
+                condition=models.Q(deleted_at__isnull=False),
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                Lower("email"),
+                name="user_email_ci_unique",
+                violation_error_message="A user with this email already exists.",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_full_name()} ({self.email})"
 
+    def soft_delete(self):
+        """
+        Hide the user immediately; the row is hard-deleted later, in batches,
+        by the purge_deleted_users command. The email is swapped for a
+        placeholder so the address can be registered again straight away.
+        """
+        self.deleted_at = timezone.now()
+        self.is_active = False
+        self.email = f"deleted-{self.pk}@deleted.invalid"
+        self.save(update_fields=["deleted_at", "is_active", "email"])
+
     def get_full_name(self):
         return f"{self.first_name} {self.last_name}".strip()
 
@@ -67,3 +182,51 @@ class User(AbstractUser):
     @property
     def is_default(self):
         return self.role == "DEFAULT"
+
+
+class ArchivedUserQuerySet(models.QuerySet):
+    def search(self, query):
+        if not query:
+            return self
+        return self.filter(
+            models.Q(first_name__icontains=query)
+            | models.Q(last_name__icontains=query)
+            | models.Q(user__email__icontains=query)
+        )
+
+    def listing_rows(self):
+        """Rows shaped like ``UserQuerySet.listing_rows`` plus ``archived``."""
+        return self.filter(user__deleted_at__isnull=True).annotate(
+            id=models.F("user_id"),
+            email=models.F("user__email"),
+            role=models.F("user__role"),
+            is_active=models.Value(False),
+            date_joined=models.F("user__date_joined"),
+            archived=models.Value(True),
+        ).values_list(*LISTING_FIELDS, "archived", named=True)
+
+
+class ArchivedUser(models.Model):
+    """
+    Cold storage for a long-inactive user. The matching User row is kept as a
+    stub (email, role, dates) so the address stays unique and login lookups
+    still find it; see accounts.archive for moving users in and out.
+    """
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="archive"
+    )
+    first_name = models.CharField(max_length=150, blank=True)
+    last_name = models.CharField(max_length=150, blank=True)
+    # password, phone, is_active and is_staff as they were when archived
+    data = models.JSONField(default=dict)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    objects = ArchivedUserQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Archived user"
+        verbose_name_plural = "Archived users"
+
+    def __str__(self):
+        return f"{self.first_name} {self.last_name} (archived)".strip()
@@ -0,0 +1,192 @@
+"""
+Streaming user reports for admins.
+
+Reports are plain querysets over ``values_list`` rows, iterated with
+``.iterator(chunk_size)`` (a server-side cursor on PostgreSQL) and encoded
+row by row, so memory stays flat regardless of table size. Output can be
+gzip-compressed on the fly.
+"""
+
+import csv
+import json
+import zlib
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+
+from .models import ArchivedUser
+
+User = get_user_model()
+
+CHUNK_SIZE = 2000
+# Encoded rows are buffered up to this many bytes before being yielded.
+FLUSH_BYTES = 64 * 1024
+
+# Upper bound for the ``days`` parameter; larger values overflow timedelta.
+MAX_DAYS = 100 * 365
+PERIODS = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+USER_COLUMNS = [
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "role",
+    "is_active",
+    "last_login",
+    "date_joined",
+]
+
+
+REPORT_COLUMNS = USER_COLUMNS + ["archived"]
+
+
+def _with_archived(hot_users, archived_users):
+    """
+    Hot user rows plus archived users under their archived names, with an
+    ``archived`` flag column. The archived side has the same column order.
+    """
+    hot_rows = hot_users.annotate(archived=Value(False)).values_list(
+        *USER_COLUMNS, "archived"
+    )
+    archived_rows = (
+        archived_users.filter(user__deleted_at__isnull=True)
+        .annotate(
+            id=F("user_id"),
+            email=F("user__email"),
+            role=F("user__role"),
+            is_active=Value(False),
+            last_login=F("user__last_login"),
+            date_joined=F("user__date_joined"),
+            archived=Value(True),
+        )
+        .values_list(*USER_COLUMNS, "archived")
+    )
+    return hot_rows.union(archived_rows, all=True)
+
+
+def users_by_role(params):
+    users = User.objects.hot()
+    archived = ArchivedUser.objects.all()
+    if params.get("role"):
+        users = users.filter(role=params["role"])
+        archived = archived.filter(user__role=params["role"])
+    return REPORT_COLUMNS, _with_archived(users, archived).order_by("role", "id")
+
+
+def signups(params):
+    trunc = PERIODS.get(params.get("period"), TruncMonth)
+    rows = (
+        User.objects.annotate(period=trunc("date_joined"))
+        .values("period", "role")
+        .annotate(signups=Count("id"))
+        .order_by("period", "role")
+        .values_list("period", "role", "signups")
+    )
+    return ["period", "role", "signups"], rows
+
+
+def inactive(params):
+    try:
+        days = int(params.get("days", 90))
+    except ValueError:
+        days = 90
+    days = min(max(days, 0), MAX_DAYS)
+    cutoff = timezone.now() - timedelta(days=days)
+    users = User.objects.hot().filter(
+        Q(is_active=False)
+        | Q(last_login__lt=cutoff)
+        | Q(last_login__isnull=True, date_joined__lt=cutoff)
+    )
+    # Archived users are the longest-dormant accounts, so all of them qualify.
+    return REPORT_COLUMNS, _with_archived(users, ArchivedUser.objects.all()).order_by("id")
+
+
+REPORTS = {
+    "users-by-role": users_by_role,
+    "signups": signups,
+    "inactive": inactive,
+}
+
+
+class _Echo:
+    """File-like object whose write() hands back the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def _serialize(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+# Leading characters that make Excel/Sheets evaluate a cell as a formula.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_cell(value):
+    # Names and emails come from the public signup form; prefixing "'" keeps
+    # a value like "=HYPERLINK(...)" as text when an admin opens the export.
+    value = _serialize(value)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def encode_csv(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_csv_cell(value) for value in row])
+
+
+def encode_ndjson(columns, rows):
+    for row in rows:
+        record = dict(zip(columns, (_serialize(value) for value in row)))
+        yield json.dumps(record, separators=(",", ":")) + "\n"
+
+
+ENCODERS = {
+    "csv": (encode_csv, "text/csv"),
+    "ndjson": (encode_ndjson, "application/x-ndjson"),
+}
+
+
+def stream_report(name, fmt, params, compress=False):
+    """
+    Return ``(chunks, content_type)`` for a report. ``chunks`` is a lazy
+    iterator of bytes; nothing touches the database until it is consumed.
+    """
+    columns, queryset = REPORTS[name](params)
+    encode, content_type = ENCODERS[fmt]
+    lines = encode(columns, queryset.iterator(chunk_size=CHUNK_SIZE))
+    chunks = _buffered(lines)
+    if compress:
+        chunks = _gzip(chunks)
+    return chunks, content_type
+
+
+def _buffered(lines):
+    buffer, size = [], 0
+    for line in lines:
+        data = line.encode()
+        buffer.append(data)
+        size += len(data)
+        if size >= FLUSH_BYTES:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _gzip(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -1,3 +1,545 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+import re
+import threading
+from datetime import timedelta
+from smtplib import SMTPException
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import Group
+from django.contrib.sessions.models import Session
+from django.core import mail
+from django.core.mail import EmailMessage, get_connection
+from django.core.management import CommandError, call_command
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .archive import archive_candidates, archive_users
+from .forms import AdminUserManagementForm
+from .checks import check_listing_fields, selected_fields
+from .models import ArchivedUser, User
+from .tokens import make_verification_token
+from .utils import email_queue
+
+
+class ManageUsersListingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email="admin@example.com", password="pass12345", first_name="Ada"
+        )
+        User.objects.create_user(
+            email="grace@example.com", password="pass12345", first_name="Grace"
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_listing_never_selects_password(self):
+        url = reverse("accounts:manage_users")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, {"q": "grace"}, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "grace@example.com")
+        # The session auth lookup legitimately loads the full row; only the
+        # paginated listing query is checked here.
+        listing_sql = [
+            q["sql"] for q in ctx.captured_queries if "ORDER BY" in q["sql"]
+        ]
+        self.assertTrue(listing_sql)
+        for sql in listing_sql:
+            self.assertNotIn('"password"', sql)
+
+    def test_listing_rows_are_not_model_instances(self):
+        row = User.objects.listing_rows().get(email="grace@example.com")
+        self.assertEqual(row.first_name, "Grace")
+        self.assertFalse(hasattr(row, "password"))
+
+    def test_listing_check_inspects_the_selected_columns(self):
+        self.assertEqual(check_listing_fields(None), [])
+        self.assertIn("password", selected_fields(User.objects.only("email").defer(None).query))
+        self.assertIn("password", selected_fields(User.objects.values_list("password").query))
+        self.assertNotIn("password", selected_fields(User.objects.only("email").query))
+        self.assertIn(
+            "password",
+            selected_fields(
+                User.objects.annotate(hash=F("password")).values_list("hash").query
+            ),
+        )
+
+
+class SeedUsersCommandTests(TestCase):
+    def test_refuses_without_debug_or_explicit_admin(self):
+        with self.assertRaises(CommandError):
+            call_command("seed_users", count=1, stdout=io.StringIO())
+        self.assertFalse(User.objects.exists())
+
+    def test_admin_password_comes_from_the_caller(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "seed_users", count=1, create_admin=True, admin_password="", stdout=io.StringIO()
+            )
+        call_command(
+            "seed_users",
+            count=1,
+            create_admin=True,
+            admin_password="Not-published-42",
+            stdout=io.StringIO(),
+        )
+        admin = User.objects.get(email="bench-admin@example.com")
+        self.assertTrue(admin.check_password("Not-published-42"))
+
+
+class EmailLookupTests(TestCase):
+    def test_login_email_is_case_insensitive(self):
+        user = User.objects.create_user(email="Mixed@Example.com", password="pass12345")
+        self.assertEqual(
+            authenticate(username="mixed@example.com", password="pass12345"), user
+        )
+
+    def test_case_clash_is_reported_on_the_email_field(self):
+        User.objects.create_user(email="Mixed@Example.com", password="pass12345")
+        form = AdminUserManagementForm(
+            {"first_name": "A", "last_name": "B", "email": "mixed@example.com", "role": "DEFAULT"}
+        )
+        self.assertFalse(form.is_valid())
+        self.assertEqual(list(form.errors), ["email"])
+
+
+# The queue's failure callback clears the dedup key from the worker thread,
+# whose database connection can't see rows written inside a TestCase
+# transaction; the dedup logic itself doesn't depend on the cache backend.
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class PasswordResetQueueTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user(email="reset@example.com", password="pass12345")
+
+    def setUp(self):
+        # Drain emails queued by earlier tests before counting the outbox.
+        email_queue.join()
+        mail.outbox = []
+        cache.clear()
+
+    def test_reset_is_sent_in_background_and_deduplicated(self):
+        url = reverse("accounts:password_reset")
+        deduplicated = email_queue.metrics.get("password_reset.deduplicated", 0)
+        for _ in range(3):
+            response = self.client.post(url, {"email": "Reset@example.com"})
+            self.assertRedirects(response, reverse("accounts:password_reset_done"))
+        email_queue.join()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["reset@example.com"])
+        self.assertEqual(len(mail.outbox[0].alternatives), 1)
+        self.assertEqual(
+            email_queue.metrics["password_reset.deduplicated"] - deduplicated, 2
+        )
+
+    def test_failed_delivery_releases_the_dedup_key(self):
+        url = reverse("accounts:password_reset")
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=SMTPException,
+        ):
+            self.client.post(url, {"email": "reset@example.com"})
+            email_queue.join()
+        self.assertEqual(mail.outbox, [])
+
+        self.client.post(url, {"email": "reset@example.com"})
+        email_queue.join()
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class EmailQueueTests(SimpleTestCase):
+    def test_waiting_emails_share_one_connection(self):
+        started, release = threading.Event(), threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(5)
+            return EmailMessage("first", "body", to=["a@example.com"])
+
+        with mock.patch("accounts.utils.get_connection", wraps=get_connection) as spy:
+            email_queue.put("test", blocker)
+            started.wait(5)
+            for n in range(3):
+                email_queue.put(
+                    "test", lambda n=n: EmailMessage(f"m{n}", "body", to=["b@example.com"])
+                )
+            release.set()
+            email_queue.join()
+
+        self.assertEqual(len(mail.outbox), 4)
+        self.assertEqual(spy.call_count, 2)
+
+    def test_drain_is_bounded(self):
+        release = threading.Event()
+        email_queue.put(
+            "test", lambda: release.wait(5) and EmailMessage("x", "y", to=["c@example.com"])
+        )
+        self.assertFalse(email_queue.drain(0.05))
+        release.set()
+        self.assertTrue(email_queue.drain(5))
+
+
+class UserReportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email="admin@example.com", password="pass12345"
+        )
+        User.objects.create_user(
+            email="manager@example.com", password="pass12345", role="MANAGER"
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_users_by_role_streams_gzipped_csv(self):
+        response = self.client.get(
+            reverse("accounts:user_report", args=["users-by-role"]),
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+        body = gzip.decompress(b"".join(response.streaming_content)).decode()
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(
+            [(r["email"], r["role"]) for r in rows],
+            [("admin@example.com", "ADMIN"), ("manager@example.com", "MANAGER")],
+        )
+        self.assertNotIn("password", rows[0])
+
+    def test_csv_neutralises_formula_cells(self):
+        User.objects.create_user(
+            email="evil@example.com",
+            password="pass12345",
+            first_name='=HYPERLINK("http://evil.example","x")',
+            last_name="@SUM(1)",
+        )
+        response = self.client.get(
+            reverse("accounts:user_report", args=["users-by-role"])
+        )
+        body = b"".join(response.streaming_content).decode()
+        row = next(
+            r for r in csv.DictReader(io.StringIO(body)) if r["email"] == "evil@example.com"
+        )
+        self.assertEqual(row["first_name"], """'=HYPERLINK("http://evil.example","x")""")
+        self.assertEqual(row["last_name"], "'@SUM(1)")
+
+    def test_signups_as_ndjson(self):
+        response = self.client.get(
+            reverse("accounts:user_report", args=["signups"]),
+            {"format": "ndjson", "period": "day"},
+        )
+        records = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual(sum(r["signups"] for r in records), 2)
+
+    def test_inactive_clamps_days_and_honours_q_zero(self):
+        response = self.client.get(
+            reverse("accounts:user_report", args=["inactive"]),
+            {"days": "99999999999"},
+            HTTP_ACCEPT_ENCODING="gzip;q=0, identity",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        b"".join(response.streaming_content)
+
+    def test_reports_are_admin_only(self):
+        self.client.force_login(User.objects.get(email="manager@example.com"))
+        response = self.client.get(reverse("accounts:user_report", args=["inactive"]))
+        self.assertEqual(response.status_code, 403)
+
+
+class SoftDeleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email="admin@example.com", password="pass12345"
+        )
+        cls.victim = User.objects.create_user(
+            email="victim@example.com", password="pass12345"
+        )
+        cls.victim.groups.add(Group.objects.create(name="staff"))
+
+    def test_delete_hides_user_and_purge_removes_row(self):
+        victim_client = self.client_class()
+        victim_client.force_login(self.victim)
+        self.client.force_login(self.admin)
+
+        self.client.post(reverse("accounts:delete_user", args=[self.victim.pk]))
+
+        self.assertFalse(User.objects.filter(pk=self.victim.pk).exists())
+        self.assertTrue(User.all_objects.filter(pk=self.victim.pk).exists())
+        # The victim's live session no longer authenticates.
+        response = victim_client.get(reverse("dashboard"))
+        self.assertRedirects(
+            response,
+            reverse("accounts:login") + "?next=/dashboard/",
+            fetch_redirect_response=False,
+        )
+        response = self.client.get(reverse("accounts:manage_users"))
+        self.assertNotContains(response, "victim@example.com")
+        # The address can be used again before the purge runs.
+        User.objects.create_user(email="victim@example.com", password="pass12345")
+
+        Session.objects.update(expire_date=timezone.now() - timedelta(days=1))
+        call_command("purge_deleted_users", batch_size=1, stdout=io.StringIO())
+
+        self.assertFalse(User.all_objects.filter(pk=self.victim.pk).exists())
+        self.assertFalse(
+            User.groups.through.objects.filter(user_id=self.victim.pk).exists()
+        )
+        self.assertFalse(Session.objects.exists())  # expired ones were cleared
+
+
+class EmailVerificationTests(TestCase):
+    def setUp(self):
+        email_queue.join()
+        mail.outbox = []
+        cache.clear()
+
+    def register(self, email="new@example.com"):
+        return self.client.post(
+            reverse("accounts:register"),
+            {
+                "first_name": "New",
+                "last_name": "User",
+                "email": email,
+                "password1": "Sup3r-secret-pass",
+                "password2": "Sup3r-secret-pass",
+            },
+        )
+
+    def test_registration_requires_verification(self):
+        response = self.register()
+        self.assertRedirects(response, reverse("accounts:verification_sent"))
+        user = User.objects.get(email="new@example.com")
+        self.assertFalse(user.is_active)
+        self.assertIsNone(authenticate(username=user.email, password="Sup3r-secret-pass"))
+
+        email_queue.join()
+        self.assertIn("/accounts/verify-email/", mail.outbox[0].body)
+
+        token = make_verification_token(user)
+        url = reverse("accounts:verify_email", args=[token])
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertRedirects(response, reverse("accounts:login"))
+        email_queue.join()
+        self.assertEqual(mail.outbox[-1].subject, "Welcome to Starter Kit, New!")
+        user.refresh_from_db()
+        self.assertTrue(user.is_active)
+        self.assertIsNotNone(user.email_verified_at)
+
+        # A used token does nothing more.
+        self.client.get(url)
+        self.assertEqual(User.objects.filter(is_active=True).count(), 1)
+
+    def test_tampered_token_is_rejected(self):
+        self.register()
+        token = make_verification_token(User.objects.get(email="new@example.com"))
+        self.client.get(reverse("accounts:verify_email", args=[token[:-2] + "xx"]))
+        self.assertFalse(User.objects.get(email="new@example.com").is_active)
+
+    def test_resend_is_rate_limited(self):
+        self.register()
+        email_queue.join()
+        url = reverse("accounts:verification_sent")
+        for _ in range(3):
+            self.client.post(url, {"email": "new@example.com"})
+        email_queue.join()
+        # Registration mail plus a single resend within the cooldown.
+        self.assertEqual(len(mail.outbox), 2)
+
+    @override_settings(TRUSTED_PROXY_COUNT=1, EMAIL_VERIFICATION_RESEND_PER_HOUR=1)
+    def test_resend_cap_is_per_forwarded_client(self):
+        url = reverse("accounts:verification_sent")
+        for n, client_ip in enumerate(["203.0.113.1", "203.0.113.2"]):
+            self.client.post(
+                url,
+                {"email": f"person{n}@example.com"},
+                REMOTE_ADDR="10.0.0.1",
+                HTTP_X_FORWARDED_FOR=f"198.51.100.9, {client_ip}",
+            )
+        response = self.client.post(
+            url,
+            {"email": "person9@example.com"},
+            REMOTE_ADDR="10.0.0.1",
+            HTTP_X_FORWARDED_FOR="203.0.113.1",
+            follow=True,
+        )
+        self.assertEqual(
+            [str(m) for m in response.context["messages"]][-1],
+            "Too many requests. Please wait a moment and try again.",
+        )
+        # Each client was counted under its own address, not the proxy's, in
+        # the database cache that all workers share.
+        self.assertTrue(cache.get("verify-resend-ip:203.0.113.2:0"))
+        self.assertIsNone(cache.get("verify-resend-ip:10.0.0.1:0"))
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT cache_key FROM django_cache")
+            keys = [row[0] for row in cursor.fetchall()]
+        self.assertTrue(any("verify-resend-ip:203.0.113.1" in key for key in keys))
+
+    def test_cleanup_soft_deletes_stale_unverified_accounts(self):
+        self.register()
+        User.objects.update(date_joined=timezone.now() - timedelta(days=30))
+        call_command("purge_unverified_users", days=7, stdout=io.StringIO())
+        self.assertFalse(User.objects.exists())
+        self.assertEqual(User.all_objects.count(), 1)
+
+
+class ArchiveTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email="admin@example.com", password="pass12345"
+        )
+        cls.sleeper = User.objects.create_user(
+            email="sleeper@example.com", password="pass12345", first_name="Rip"
+        )
+        User.objects.filter(pk=cls.sleeper.pk).update(
+            last_login=timezone.now() - timedelta(days=800)
+        )
+
+    def archive(self):
+        call_command("archive_inactive_users", months=12, stdout=io.StringIO())
+        self.sleeper.refresh_from_db()
+
+    def test_command_moves_inactive_users_to_the_archive(self):
+        self.archive()
+        self.assertTrue(self.sleeper.is_archived)
+        self.assertEqual(self.sleeper.first_name, "")
+        self.assertFalse(self.sleeper.has_usable_password())
+        self.assertEqual(ArchivedUser.objects.get().first_name, "Rip")
+        # Superusers and recently active users stay hot.
+        self.assertEqual(User.objects.hot().get(), self.admin)
+
+    def test_listing_only_reads_the_archive_when_asked(self):
+        self.archive()
+        self.client.force_login(self.admin)
+        url = reverse("accounts:manage_users")
+
+        response = self.client.get(url, {"q": "rip"}, HTTP_HX_REQUEST="true")
+        self.assertNotContains(response, "sleeper@example.com")
+
+        response = self.client.get(
+            url, {"q": "rip", "archived": "1"}, HTTP_HX_REQUEST="true"
+        )
+        self.assertContains(response, "sleeper@example.com")
+        self.assertContains(response, "Archived")
+        # Stat cards count hot users only.
+        self.assertEqual(self.client.get(url).context["total_users"], 1)
+
+    def test_reports_list_archived_users_under_their_names(self):
+        self.archive()
+        self.client.force_login(self.admin)
+        reports = {}
+        for report, params in [("users-by-role", {}), ("inactive", {"days": 365})]:
+            response = self.client.get(
+                reverse("accounts:user_report", args=[report]), params
+            )
+            body = b"".join(response.streaming_content).decode()
+            reports[report] = {r["email"]: r for r in csv.DictReader(io.StringIO(body))}
+            self.assertEqual(reports[report]["sleeper@example.com"]["first_name"], "Rip")
+            self.assertEqual(reports[report]["sleeper@example.com"]["archived"], "True")
+
+        self.assertEqual(reports["users-by-role"]["admin@example.com"]["archived"], "False")
+        # The admin joined just now, so isn't inactive yet.
+        self.assertNotIn("admin@example.com", reports["inactive"])
+
+    def test_users_active_since_selection_are_not_archived(self):
+        candidates = archive_candidates(12)
+        # A login lands after the candidate query was built: the batch is
+        # read (and the cutoff re-checked) inside the archiving transaction.
+        User.objects.filter(pk=self.sleeper.pk).update(last_login=timezone.now())
+        self.assertEqual(archive_users(candidates), 0)
+        self.sleeper.refresh_from_db()
+        self.assertFalse(self.sleeper.is_archived)
+        self.assertFalse(ArchivedUser.objects.exists())
+
+    def test_login_restores_only_with_the_right_password(self):
+        self.archive()
+        self.assertIsNone(authenticate(username="sleeper@example.com", password="wrong"))
+        self.assertTrue(ArchivedUser.objects.exists())
+
+        user = authenticate(username="Sleeper@example.com", password="pass12345")
+        self.assertEqual(user, self.sleeper)
+        user.refresh_from_db()
+        self.assertFalse(user.is_archived)
+        self.assertTrue(user.is_active)
+        self.assertEqual(user.first_name, "Rip")
+        self.assertFalse(ArchivedUser.objects.exists())
+
+    def test_password_reset_restores_only_once_confirmed(self):
+        archive_users(User.objects.filter(pk=self.sleeper.pk))
+        email_queue.join()
+        mail.outbox = []
+        cache.clear()
+
+        self.client.post(
+            reverse("accounts:password_reset"), {"email": "sleeper@example.com"}
+        )
+        email_queue.join()
+
+        # Asking for a reset proves nothing, so the account stays archived.
+        self.sleeper.refresh_from_db()
+        self.assertTrue(self.sleeper.is_archived)
+        self.assertEqual(mail.outbox[0].to, ["sleeper@example.com"])
+        self.assertIn("Hi Rip,", mail.outbox[0].body)
+
+        link = re.search(r"/accounts/password-reset-confirm/\S+/", mail.outbox[0].body)[0]
+        response = self.client.get(link, follow=True)
+        self.client.post(
+            response.redirect_chain[-1][0],
+            {"new_password1": "Fresh-pass-4567", "new_password2": "Fresh-pass-4567"},
+        )
+
+        self.sleeper.refresh_from_db()
+        self.assertFalse(self.sleeper.is_archived)
+        self.assertEqual(self.sleeper.first_name, "Rip")
+        self.assertTrue(self.sleeper.check_password("Fresh-pass-4567"))
+        self.assertFalse(ArchivedUser.objects.exists())
+
+    def test_hot_indexes_leave_archived_stubs_out(self):
+        # Whether the planner picks them depends on table size; see the
+        # explain_queries command for plans. Here only their shape is checked.
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, User._meta.db_table
+            )
+        expected = {
+            "user_hot_joined_idx": ["date_joined"],
+            "user_hot_role_joined_idx": ["role", "date_joined"],
+        }
+        for name, columns in expected.items():
+            self.assertTrue(constraints[name]["index"])
+            self.assertEqual(constraints[name]["columns"], columns)
+            self.assertIn("is_archived", self.index_definition(name))
+
+    def index_definition(self, name):
+        queries = {
+            "postgresql": "SELECT indexdef FROM pg_indexes WHERE indexname = %s",
+            "sqlite": "SELECT sql FROM sqlite_master WHERE name = %s",
+        }
+        if connection.vendor not in queries:
+            self.skipTest(f"no index definition lookup for {connection.vendor}")
+        with connection.cursor() as cursor:
+            cursor.execute(queries[connection.vendor], [name])
+            return cursor.fetchone()[0]
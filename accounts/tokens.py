@@ -0,0 +1,28 @@
+"""
+Stateless email verification tokens.
+
+A token is the user's id, email and first name, signed and timestamped with
+``django.core.signing`` (HMAC over SECRET_KEY). Nothing is stored server-side:
+the signature proves authenticity, the timestamp bounds the lifetime, and
+``email_verified_at`` being set makes a used token inert.
+"""
+
+from django.conf import settings
+from django.core import signing
+
+SALT = "accounts.email-verification"
+
+
+def make_verification_token(user):
+    payload = {"u": user.pk, "e": user.email, "n": user.first_name}
+    return signing.dumps(payload, salt=SALT, compress=True)
+
+
+def read_verification_token(token):
+    """Return the payload dict, or None if the token is forged or expired."""
+    try:
+        return signing.loads(
+            token, salt=SALT, max_age=settings.EMAIL_VERIFICATION_MAX_AGE
+        )
+    except signing.BadSignature:  # SignatureExpired is a subclass
+        return None
@@ -1,17 +1,20 @@
 from django.urls import path, reverse_lazy
 from django.contrib.auth import views as auth_views
-from .forms import AsyncPasswordResetForm
+from .forms import ArchiveRestoringSetPasswordForm, AsyncPasswordResetForm
 from . import views
 
 app_name = "accounts"
 urlpatterns = [
     path("login/", auth_views.LoginView.as_view(template_name="accounts/login.html"), name="login"),
     path("register/", views.register_view, name="register"),
+    path("verify-email/", views.verification_sent, name="verification_sent"),
+    path("verify-email/<str:token>/", views.verify_email, name="verify_email"),
     path("logout/", auth_views.LogoutView.as_view(next_page="home"), name="logout"),
     
     path("users/", views.manage_users, name="manage_users"),
     path("users/edit/<int:user_id>/", views.edit_user, name="edit_user"),
     path("users/delete/<int:user_id>/", views.delete_user, name="delete_user"),
+    path("users/reports/<slug:report>/", views.user_report, name="user_report"),
     path("profile/", views.profile_view, name="profile"),
     
     # Password Reset
@@ -35,6 +38,7 @@ urlpatterns = [
         "password-reset-confirm/<uidb64>/<token>/",
         auth_views.PasswordResetConfirmView.as_view(
             template_name="accounts/registration/password_reset_confirm.html",
+            form_class=ArchiveRestoringSetPasswordForm,
             success_url=reverse_lazy("accounts:password_reset_complete"),
         ),
         name="password_reset_confirm",
@@ -1,28 +1,179 @@
+import atexit
+import logging
+import queue
 import threading
-from django.core.mail import EmailMultiAlternatives
+import time
+from collections import Counter
+
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.conf import settings
 
-class EmailThread(threading.Thread):
+logger = logging.getLogger(__name__)
+
+
+class EmailQueue:
     """
-    A separate thread that handles the actual sending of the email 
-    so the main Django process doesn't get blocked.
+    A per-process background worker that renders and sends queued emails,
+    so the request only pays for putting a job on the queue.
+
+    Jobs are callables returning an EmailMessage; rendering happens inside
+    the job, on the worker thread. Jobs that are already waiting are sent
+    together over one backend connection. Outcomes are counted (see
+    ``metrics``) and logged with their key fields in the message.
     """
-    def __init__(self, email):
-        self.email = email
-        threading.Thread.__init__(self)
 
-    def run(self):
-        self.email.send(fail_silently=True)
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._metrics = Counter()
+        # The worker is a daemon so it never blocks shutdown on its own; this
+        # hands it a bounded window to flush what is still queued instead.
+        atexit.register(self._drain_at_exit)
+
+    @property
+    def metrics(self):
+        """A snapshot of this process's counters, e.g. ``password_reset.sent``."""
+        with self._lock:
+            return dict(self._metrics)
+
+    def incr(self, name):
+        with self._lock:
+            self._metrics[name] += 1
+
+    def put(self, kind, build_message, on_failure=None):
+        """Queue a job; ``on_failure`` is called (on the worker) if it is not sent."""
+        self._ensure_worker()
+        self.incr(f"{kind}.queued")
+        self._queue.put((kind, build_message, on_failure, time.monotonic()))
+
+    def join(self):
+        """Block until every queued email has been handled (used by tests/benchmarks)."""
+        self._queue.join()
+
+    def drain(self, timeout):
+        """Wait up to ``timeout`` seconds for the queue to empty; True if it did."""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _drain_at_exit(self):
+        if self._worker is None or not self._worker.is_alive():
+            return
+        if not self.drain(settings.EMAIL_QUEUE_DRAIN_TIMEOUT):
+            logger.error(
+                "Email queue not drained at exit pending=%d",
+                self._queue.unfinished_tasks,
+            )
+
+    def _ensure_worker(self):
+        # Started lazily so that each forked server worker gets its own thread.
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="email-queue", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            jobs = [self._queue.get()]
+            while len(jobs) < settings.EMAIL_QUEUE_BATCH_SIZE:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._send_batch(jobs)
+            finally:
+                for _ in jobs:
+                    self._queue.task_done()
+
+    def _send_batch(self, jobs):
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception:
+            logger.exception("Email connection failed batch=%d", len(jobs))
+            for kind, _, on_failure, _ in jobs:
+                self._failed(kind, on_failure)
+            return
+
+        try:
+            for kind, build_message, on_failure, queued_at in jobs:
+                started = time.monotonic()
+                try:
+                    message = build_message()
+                    # The connection is already open, so the backend reuses it.
+                    connection.send_messages([message])
+                except Exception:
+                    logger.exception("Email delivery failed kind=%s", kind)
+                    self._failed(kind, on_failure)
+                    # The error may have dropped the connection; the backend
+                    # opens a new one per message from here on if reopening fails.
+                    connection.close()
+                    try:
+                        connection.open()
+                    except Exception:
+                        pass
+                    continue
+                self.incr(f"{kind}.sent")
+                logger.info(
+                    "Email sent kind=%s recipients=%d queue_wait_ms=%.1f "
+                    "send_ms=%.1f batch=%d",
+                    kind,
+                    len(message.recipients()),
+                    (started - queued_at) * 1000,
+                    (time.monotonic() - started) * 1000,
+                    len(jobs),
+                )
+        finally:
+            connection.close()
+
+    def _failed(self, kind, on_failure):
+        self.incr(f"{kind}.failed")
+        if on_failure is not None:
+            try:
+                on_failure()
+            except Exception:
+                logger.exception("Email failure callback raised kind=%s", kind)
+
+
+email_queue = EmailQueue()
+
+
+def client_ip(request):
+    """
+    The client's address. Behind TRUSTED_PROXY_COUNT reverse proxies it is
+    read from X-Forwarded-For, counting from the right: entries further left
+    are supplied by the client and can be forged.
+    """
+    proxies = settings.TRUSTED_PROXY_COUNT
+    if proxies:
+        forwarded = [
+            ip.strip()
+            for ip in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+            if ip.strip()
+        ]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def build_html_email(subject, template_name, context, recipient_list):
+    """Renders an HTML template into a multipart (HTML + plain text) message."""
+    context['site_url'] = getattr(settings, 'SITE_URL', 'http://127.0.0.1:8000')
 
-def send_html_email(subject, template_name, context, recipient_list):
-    """Renders an HTML template and sends a multipart email asynchronously."""
-    context['site_url'] = getattr(settings, 'SITE_URL', 'http://127.0.0.1:8000') 
-    
     html_message = render_to_string(template_name, context)
     plain_message = strip_tags(html_message)
-    
+
     email = EmailMultiAlternatives(
         subject=subject,
         body=plain_message,
@@ -30,6 +181,12 @@ def send_html_email(subject, template_name, context, recipient_list):
         to=recipient_list
     )
     email.attach_alternative(html_message, "text/html")
-    
-    # Hand the email object to the thread and start it immediately
-    EmailThread(email).start()
\ No newline at end of file
+    return email
+
+def send_html_email(subject, template_name, context, recipient_list):
+    """Queues a multipart email; rendering and sending happen in the background."""
+    kind = template_name.rsplit("/", 1)[-1].removesuffix(".html")
+    email_queue.put(
+        kind,
+        lambda: build_html_email(subject, template_name, context, recipient_list),
+    )
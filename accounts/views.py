@@ -1,12 +1,23 @@
+import hashlib
+
+from django.core.cache import cache
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.contrib.auth import get_user_model, login, update_session_auth_hash
+from django.contrib.auth import get_user_model, update_session_auth_hash
 from django.contrib.auth.forms import PasswordChangeForm
 from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Value
 from django.conf import settings
-from .utils import send_html_email
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from main.middleware import accepts_encoding
+from .reports import ENCODERS, REPORTS, stream_report
+from .tokens import make_verification_token, read_verification_token
+from .utils import client_ip, send_html_email
+from .models import LISTING_FIELDS, ArchivedUser
 from .forms import UserProfileForm, AdminUserManagementForm, RegistrationForm
 from .decorators import allowed_users
 
@@ -20,42 +31,137 @@ def register_view(request):
     if request.method == "POST":
         form = RegistrationForm(request.POST)
         if form.is_valid():
-            user = form.save()
-            # Send Welcome Email
-            send_html_email(
-                subject=f"Welcome to Starter Kit, {user.first_name}!",
-                template_name="emails/welcome.html",
-                context={"user": user},
-                recipient_list=[user.email],
-            )
-            login(request, user)
-            messages.success(request, "Registration successful. Welcome!")
-            return redirect("accounts:profile")
+            # The account stays inactive until the emailed link is opened.
+            user = form.save(commit=False)
+            user.is_active = False
+            user.save()
+            send_verification_email(user)
+            request.session["verification_email"] = user.email
+            return redirect("accounts:verification_sent")
     else:
         form = RegistrationForm()
 
     return render(request, "accounts/register.html", {"form": form})
 
 
+# --- EMAIL VERIFICATION ---
+def send_verification_email(user):
+    token = make_verification_token(user)
+    verification_url = settings.SITE_URL.rstrip("/") + reverse(
+        "accounts:verify_email", args=[token]
+    )
+    send_html_email(
+        subject="Verify your email address — Starter Kit",
+        template_name="emails/email_verification.html",
+        context={"user": user, "verification_url": verification_url},
+        recipient_list=[user.email],
+    )
+
+
+def resend_allowed(request, email):
+    """
+    Per-address cooldown plus an hourly cap per client IP, kept in the shared
+    cache so every worker enforces the same limits. The cap claims one of N
+    slots with cache.add, which (unlike incr) is atomic on the database cache.
+    """
+    ip_key = f"verify-resend-ip:{client_ip(request)}"
+    if not any(
+        cache.add(f"{ip_key}:{slot}", True, 3600)
+        for slot in range(settings.EMAIL_VERIFICATION_RESEND_PER_HOUR)
+    ):
+        return False
+
+    digest = hashlib.sha256(email.lower().encode()).hexdigest()
+    return cache.add(
+        f"verify-resend:{digest}", True, settings.EMAIL_VERIFICATION_RESEND_COOLDOWN
+    )
+
+
+def verification_sent(request):
+    """'Check your inbox' page; POSTing an email address resends the link."""
+    email = request.session.get("verification_email", "")
+
+    if request.method == "POST":
+        email = request.POST.get("email", "").strip()
+        if email and not resend_allowed(request, email):
+            messages.warning(
+                request, "Too many requests. Please wait a moment and try again."
+            )
+        elif email:
+            user = (
+                User.objects.filter(is_active=False, email_verified_at__isnull=True)
+                .by_email(email)
+                .first()
+            )
+            if user is not None:
+                send_verification_email(user)
+            # Same answer either way, so the form can't be used to probe accounts.
+            messages.success(
+                request,
+                "If an unverified account exists for that address, a new link is on its way.",
+            )
+        request.session["verification_email"] = email
+        return redirect("accounts:verification_sent")
+
+    return render(request, "accounts/verification_sent.html", {"email": email})
+
+
+def verify_email(request, token):
+    payload = read_verification_token(token)
+    if payload is None:
+        messages.error(
+            request, "This verification link is invalid or has expired. Request a new one below."
+        )
+        return redirect("accounts:verification_sent")
+
+    # The signature already vouches for the payload: a single UPDATE both
+    # checks the token is unused and activates the account.
+    verified = User.objects.filter(
+        pk=payload["u"], email=payload["e"], email_verified_at__isnull=True
+    ).update(is_active=True, email_verified_at=timezone.now())
+
+    if not verified:
+        messages.info(request, "Your email address is already verified. Please sign in.")
+        return redirect("accounts:login")
+
+    send_html_email(
+        subject=f"Welcome to Starter Kit, {payload['n']}!",
+        template_name="emails/welcome.html",
+        # Unsaved instance built from the token: no query needed to render.
+        context={"user": User(first_name=payload["n"], email=payload["e"])},
+        recipient_list=[payload["e"]],
+    )
+    messages.success(request, "Your email address is verified. You can now sign in.")
+    return redirect("accounts:login")
+
+
 # --- MANAGE USERS ---
 @login_required
 @allowed_users(allowed_roles=["ADMIN", "MANAGER"])
 def manage_users(request):
-    users = User.objects.all().order_by("-date_joined")
-
     search_query = request.GET.get("q", "").strip()
-    if search_query:
-        users = users.filter(
-            Q(first_name__icontains=search_query)
-            | Q(last_name__icontains=search_query)
-            | Q(email__icontains=search_query)
-        )
-
     role_filter = request.GET.get("role", "")
+    include_archived = request.GET.get("archived") == "1"
+
+    users = User.objects.hot().search(search_query)
     if role_filter:
         users = users.filter(role=role_filter)
 
-    paginator = Paginator(users, 10)
+    if include_archived:
+        # The archive table is only queried when the toggle is on.
+        archived = ArchivedUser.objects.search(search_query)
+        if role_filter:
+            archived = archived.filter(user__role=role_filter)
+        users = (
+            users.annotate(archived=Value(False))
+            .values_list(*LISTING_FIELDS, "archived", named=True)
+            .union(archived.listing_rows(), all=True)
+        )
+    else:
+        users = users.listing_rows()
+    users = users.order_by("-date_joined")
+
+    paginator = Paginator(users, settings.USERS_PER_PAGE)
     page_number = request.GET.get("page")
     page_obj = paginator.get_page(page_number)
 
@@ -66,6 +172,8 @@ def manage_users(request):
         form = AdminUserManagementForm(request.POST)
         if form.is_valid():
             new_user = form.save(commit=False)
+            # Addresses entered by an admin are trusted without a round trip.
+            new_user.email_verified_at = timezone.now()
             password = request.POST.get("password")
             if password:
                 new_user.set_password(password)
@@ -88,7 +196,8 @@ def manage_users(request):
     else:
         form = AdminUserManagementForm()
 
-    counts = User.objects.aggregate(
+    counts = User.objects.hot().aggregate(
+        total=Count("id"),
         admins=Count("id", filter=Q(role="ADMIN")),
         managers=Count("id", filter=Q(role="MANAGER")),
         default=Count("id", filter=Q(role="DEFAULT")),
@@ -98,17 +207,39 @@ def manage_users(request):
         "users": page_obj,
         "page_obj": page_obj,
         "form": form,
-        "total_users": User.objects.count(),
+        "total_users": counts["total"],
         "total_admins": counts["admins"],
         "total_managers": counts["managers"],
         "total_default": counts["default"],
         "roles": User.ROLE_CHOICES,
         "search_query": search_query,
         "role_filter": role_filter,
+        "include_archived": include_archived,
     }
     return render(request, "accounts/manage_users.html", context)
 
 
+# --- REPORTS ---
+@login_required
+@allowed_users(allowed_roles=["ADMIN"])
+def user_report(request, report):
+    """Streams a report as CSV or NDJSON, gzipped when the client accepts it."""
+    fmt = request.GET.get("format", "csv")
+    if report not in REPORTS or fmt not in ENCODERS:
+        raise Http404("Unknown report.")
+
+    compress = accepts_encoding(request, "gzip")
+    chunks, content_type = stream_report(report, fmt, request.GET, compress=compress)
+
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    filename = f"{report}-{timezone.now():%Y%m%d}.{fmt}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if compress:
+        response["Content-Encoding"] = "gzip"
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
+
 # --- UPDATED EDIT USER (Detects Activation) ---
 @login_required
 @allowed_users(allowed_roles=["ADMIN", "MANAGER"])
@@ -146,7 +277,8 @@ def edit_user(request, user_id):
 def delete_user(request, user_id):
     user_to_delete = get_object_or_404(User, id=user_id)
     if request.method == "POST":
-        user_to_delete.delete()
+        # Soft delete only; purge_deleted_users removes the row in the background.
+        user_to_delete.soft_delete()
         messages.success(request, "User deleted successfully.")
         return redirect("accounts:manage_users")
     return redirect("accounts:manage_users")
@@ -10,6 +10,9 @@ python manage.py collectstatic --no-input
 # Apply database migrations
 python manage.py migrate
 
+# Table for the shared database cache (rate limits, reset deduplication)
+python manage.py createcachetable
+
 # Create Superuser automatically if credentials are provided in the environment
 python manage.py shell -c "
 import os
@@ -52,6 +52,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'main.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -67,8 +68,15 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # HTML templates are minified once, when the cached loader first
+            # reads them from disk.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'main.loaders.FilesystemLoader',
+                    'main.loaders.AppDirectoriesLoader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
@@ -82,6 +90,9 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 AUTH_USER_MODEL = 'accounts.User'
 
+# Restores archived users (see accounts/archive.py) when they sign in
+AUTHENTICATION_BACKENDS = ['accounts.backends.ArchiveAwareBackend']
+
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
@@ -165,6 +176,12 @@ STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# Dynamic HTML/JSON compression (main.middleware.CompressionMiddleware).
+# Brotli is used for JSON when the optional `brotli` package is installed;
+# HTML always gets padded gzip (BREACH).
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=200, cast=int)
+COMPRESSION_BROTLI_QUALITY = config('COMPRESSION_BROTLI_QUALITY', default=5, cast=int)
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
@@ -174,11 +191,26 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Password reset token valid for 1 hour
 PASSWORD_RESET_TIMEOUT = 3600
 
+# Repeated reset requests for one address within this window send no new email
+PASSWORD_RESET_DEDUP_SECONDS = config('PASSWORD_RESET_DEDUP_SECONDS', default=PASSWORD_RESET_TIMEOUT, cast=int)
+
+# Email verification links are valid for 48 hours
+EMAIL_VERIFICATION_MAX_AGE = 48 * 3600
+# One resend per address per cooldown, and a cap per client IP per hour
+EMAIL_VERIFICATION_RESEND_COOLDOWN = config('EMAIL_VERIFICATION_RESEND_COOLDOWN', default=60, cast=int)
+EMAIL_VERIFICATION_RESEND_PER_HOUR = config('EMAIL_VERIFICATION_RESEND_PER_HOUR', default=5, cast=int)
+# Number of reverse proxies in front of the app (1 on Render); client IPs are
+# then read from X-Forwarded-For instead of the proxy's REMOTE_ADDR.
+TRUSTED_PROXY_COUNT = config('TRUSTED_PROXY_COUNT', default=0, cast=int)
+
 # Where Django redirects after login/logout
 LOGIN_URL          = 'accounts:login'
 LOGIN_REDIRECT_URL = 'dashboard'
 LOGOUT_REDIRECT_URL = 'accounts:login'
 
+# Rows per page on the user management table
+USERS_PER_PAGE = config('USERS_PER_PAGE', default=10, cast=int)
+
 # Message tags map to Bootstrap alert classes
 from django.contrib.messages import constants as messages
 MESSAGE_TAGS = {
@@ -200,6 +232,41 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='Starter Kit <noreply@yourdomain.com>')
 
+# Shared cache for rate limits and deduplication (password reset, verification
+# resends). Every gunicorn worker must see the same counters, so a per-process
+# LocMemCache won't do; the table is created by `manage.py createcachetable`.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+    }
+}
+
+# Background email queue: waiting emails are sent over one connection, in
+# batches of up to EMAIL_QUEUE_BATCH_SIZE; on shutdown a worker waits up to
+# EMAIL_QUEUE_DRAIN_TIMEOUT seconds (keep it below the gunicorn graceful
+# timeout) for queued emails to go out.
+EMAIL_QUEUE_BATCH_SIZE = config('EMAIL_QUEUE_BATCH_SIZE', default=50, cast=int)
+EMAIL_QUEUE_DRAIN_TIMEOUT = config('EMAIL_QUEUE_DRAIN_TIMEOUT', default=20, cast=int)
+
+# Background email queue outcomes are logged by the accounts app
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {'format': '{levelname} {name}: {message}', 'style': '{'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'simple'},
+    },
+    'loggers': {
+        'accounts': {
+            'handlers': ['console'],
+            'level': config('ACCOUNTS_LOG_LEVEL', default='INFO'),
+        },
+    },
+}
+
 SITE_NAME = config('SITE_NAME', default='Starter')
 SITE_URL = config('SITE_URL', default='http://127.0.0.1:8000')
 
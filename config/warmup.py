@@ -0,0 +1,74 @@
+"""
+Worker warm-up: do the one-off work a cold worker would otherwise do on its
+first request (template compilation, URL resolver population, DB connect).
+
+Used by gunicorn.conf.py and by the measure_startup management command.
+"""
+
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.template import engines
+from django.template.exceptions import TemplateDoesNotExist, TemplateSyntaxError
+from django.urls import get_resolver
+
+
+def template_names(engine):
+    """The project's own .html templates (third-party app templates are skipped)."""
+    names = set()
+    for directory in engine.template_dirs:
+        root = Path(directory)
+        # A virtualenv inside the project still holds third-party templates.
+        if not root.is_relative_to(settings.BASE_DIR) or "site-packages" in root.parts:
+            continue
+        names.update(str(path.relative_to(root)) for path in root.rglob("*.html"))
+    return sorted(names)
+
+
+def warm_templates():
+    # Only pays off with the cached loader (the default when DEBUG is off);
+    # otherwise templates are re-read on every render anyway.
+    count = 0
+    for engine in engines.all():
+        for name in template_names(engine):
+            try:
+                engine.get_template(name)
+                count += 1
+            except (TemplateDoesNotExist, TemplateSyntaxError):
+                pass
+    return count
+
+
+def warm_urls():
+    resolver = get_resolver()
+    # Populating reverse_dict builds the resolver's lookup tables up front.
+    resolver.reverse_dict
+    return len(resolver.url_patterns)
+
+
+def warm_database():
+    for alias in connections:
+        connections[alias].ensure_connection()
+    return len(connections.all())
+
+
+def close_database():
+    """Drop connections opened before fork; sockets must not be shared."""
+    connections.close_all()
+
+
+def warm_up(database=True):
+    """Run every warm-up step and return the time each took, in milliseconds."""
+    steps = [("templates", warm_templates), ("urls", warm_urls)]
+    if database:
+        steps.append(("database", warm_database))
+
+    timings = {}
+    for name, step in steps:
+        start = time.perf_counter()
+        step()
+        timings[name] = round((time.perf_counter() - start) * 1000, 2)
+    return timings
+
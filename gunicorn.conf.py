@@ -0,0 +1,140 @@
+"""
+Gunicorn server profile. Picked up automatically when gunicorn is started
+from the project root:
+
+    gunicorn
+
+Don't pass the app on the command line: it would override ``wsgi_app``
+below, which switches to the ASGI app for the uvicorn worker class.
+
+Every value can be overridden through the environment (GUNICORN_*) or on the
+command line. The CPU-based worker count is only a starting point and is
+capped at GUNICORN_MAX_WORKERS; in production set WEB_CONCURRENCY (or
+GUNICORN_WORKERS) to what the instance's memory can hold.
+"""
+
+import math
+import os
+
+
+def env(name, default=None):
+    """Environment value, treating a blank variable (``GUNICORN_WORKERS=``) as unset."""
+    return os.environ.get(name) or default
+
+
+def env_int(name, default):
+    return int(env(name, default))
+
+
+def available_cpus():
+    """
+    CPUs this process may actually use: the scheduler affinity mask, further
+    limited by a cgroup v2 CPU quota (containers). os.cpu_count() reports the
+    whole host instead.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS has no sched_getaffinity
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(cpus, 1)
+
+
+cpu_count = available_cpus()
+# Every preloaded worker is a full Django process; don't let a big host turn
+# the CPU-based default into more workers than a small container can hold.
+max_default_workers = env_int("GUNICORN_MAX_WORKERS", 8)
+
+
+# sync | gthread | uvicorn
+worker_type = env("GUNICORN_WORKER_CLASS", "gthread")
+
+if worker_type == "uvicorn":
+    # ASGI: one event loop per core (needs `pip install uvicorn`).
+    worker_class = "uvicorn.workers.UvicornWorker"
+    wsgi_app = "config.asgi:application"
+    default_workers, default_threads = cpu_count, 1
+elif worker_type == "gthread":
+    # Threads cover I/O waits (DB, SMTP), so fewer processes are needed.
+    worker_class = "gthread"
+    wsgi_app = "config.wsgi:application"
+    default_workers, default_threads = cpu_count + 1, 4
+else:
+    worker_class = "sync"
+    wsgi_app = "config.wsgi:application"
+    default_workers, default_threads = cpu_count * 2 + 1, 1
+
+workers = env_int(
+    "GUNICORN_WORKERS",
+    env("WEB_CONCURRENCY", min(default_workers, max_default_workers)),
+)
+threads = env_int("GUNICORN_THREADS", default_threads)
+
+bind = env("GUNICORN_BIND", f"0.0.0.0:{env('PORT', '8000')}")
+timeout = env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = env_int("GUNICORN_KEEPALIVE", 5)
+
+# Load Django once in the master so workers share its memory copy-on-write.
+preload_app = env("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Recycle workers periodically to bound slow leaks; the jitter keeps them from
+# all restarting at the same moment.
+max_requests = env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+
+accesslog = env("GUNICORN_ACCESSLOG", "-")
+errorlog = "-"
+loglevel = env("GUNICORN_LOGLEVEL", "info")
+
+warm_up_enabled = env("GUNICORN_WARM_UP", "true").lower() == "true"
+
+
+def when_ready(server):
+    # With preload_app the application is already imported here: compile the
+    # templates and URL resolvers once in the master so every fork inherits
+    # them, then drop any DB connection opened while loading.
+    if not (preload_app and warm_up_enabled):
+        return
+    from config.warmup import close_database, warm_up
+
+    timings = warm_up(database=False)
+    close_database()
+    server.log.info("Master warm-up done: %s", timings)
+
+
+def post_worker_init(worker):
+    # Runs in each worker after the app is loaded and before it accepts
+    # connections. Without preload the full warm-up happens here.
+    if not warm_up_enabled:
+        return
+    from config.warmup import close_database, warm_database, warm_up
+
+    if preload_app:
+        # Fails fast when the database is unreachable, before the worker takes
+        # traffic. Connections are per thread: only a sync worker serves
+        # requests on this (main) thread and can reuse the connection, so the
+        # other classes close it rather than hold an idle one for life.
+        warm_database()
+        worker.log.info("Worker %s connected to the database", worker.pid)
+    else:
+        worker.log.info("Worker %s warm-up done: %s", worker.pid, warm_up())
+    if worker_class != "sync":
+        close_database()
+
+
+def worker_exit(server, worker):
+    # Give emails still on the background queue a bounded chance to go out
+    # before a recycled or stopped worker disappears.
+    from django.conf import settings
+
+    from accounts.utils import email_queue
+
+    if not email_queue.drain(settings.EMAIL_QUEUE_DRAIN_TIMEOUT):
+        worker.log.warning("Worker %s exited with emails still queued", worker.pid)
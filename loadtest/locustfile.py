@@ -0,0 +1,111 @@
+"""
+Scripted load scenario for the auth and admin flows.
+
+Seed the target database first, creating the admin account with your own
+password (``BENCH_ADMIN_PASSWORD=... python manage.py seed_users --create-admin``),
+then:
+
+    pip install locust
+    locust -f loadtest/locustfile.py --host http://127.0.0.1:8000
+
+Environment variables:
+    BENCH_ADMIN_EMAIL / BENCH_ADMIN_PASSWORD  credentials of an ADMIN account
+    BENCH_USER_COUNT                          how many seeded users to pick from
+"""
+
+import os
+import random
+import re
+
+from locust import HttpUser, between, task
+
+BENCH_PASSWORD = "bench-pass-123"
+BENCH_EMAIL_TEMPLATE = "bench-user-{n}@example.com"
+USER_COUNT = int(os.environ.get("BENCH_USER_COUNT", 10_000))
+CSRF_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+def csrf_token(response):
+    match = CSRF_RE.search(response.text)
+    return match.group(1) if match else ""
+
+
+class Visitor(HttpUser):
+    """Anonymous traffic: public pages, password resets and logins."""
+
+    weight = 3
+    wait_time = between(1, 3)
+
+    @task(5)
+    def public_pages(self):
+        self.client.get(random.choice(["/", "/contact/", "/privacy/", "/terms/"]))
+
+    @task(2)
+    def login_and_dashboard(self):
+        page = self.client.get("/accounts/login/")
+        self.client.post(
+            "/accounts/login/",
+            {
+                "csrfmiddlewaretoken": csrf_token(page),
+                "username": BENCH_EMAIL_TEMPLATE.format(n=random.randrange(10)),
+                "password": BENCH_PASSWORD,
+            },
+            name="/accounts/login/ [POST]",
+        )
+        self.client.get("/dashboard/")
+        self.client.cookies.clear()
+
+    @task(1)
+    def password_reset(self):
+        page = self.client.get("/accounts/password-reset/")
+        self.client.post(
+            "/accounts/password-reset/",
+            {
+                "csrfmiddlewaretoken": csrf_token(page),
+                "email": BENCH_EMAIL_TEMPLATE.format(n=random.randrange(USER_COUNT)),
+            },
+            name="/accounts/password-reset/ [POST]",
+        )
+
+
+class Admin(HttpUser):
+    """A logged-in admin paging, searching and filtering the user table."""
+
+    weight = 1
+    wait_time = between(0.5, 2)
+
+    def on_start(self):
+        page = self.client.get("/accounts/login/")
+        self.client.post(
+            "/accounts/login/",
+            {
+                "csrfmiddlewaretoken": csrf_token(page),
+                "username": os.environ.get("BENCH_ADMIN_EMAIL", "bench-admin@example.com"),
+                "password": os.environ["BENCH_ADMIN_PASSWORD"],
+            },
+            name="/accounts/login/ [POST]",
+        )
+
+    def htmx(self, params, name):
+        self.client.get(
+            "/accounts/users/",
+            params=params,
+            headers={"HX-Request": "true"},
+            name=name,
+        )
+
+    @task(3)
+    def first_page(self):
+        self.client.get("/accounts/users/")
+
+    @task(3)
+    def search(self):
+        self.htmx({"q": random.choice(["smith", "grace", "bench-user-4", "kim"])}, "users [search]")
+
+    @task(2)
+    def role_filter(self):
+        self.htmx({"role": random.choice(["ADMIN", "MANAGER", "DEFAULT"])}, "users [role]")
+
+    @task(1)
+    def deep_page(self):
+        self.htmx({"page": random.randint(1, USER_COUNT // 10)}, "users [page]")
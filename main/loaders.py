@@ -0,0 +1,50 @@
+"""
+Template loaders that minify HTML templates as they are read from disk.
+
+They sit under Django's cached loader (see TEMPLATES in settings), so the
+minification runs once per template at load time, never per request.
+"""
+
+import re
+
+from django.template.loaders import app_directories, filesystem
+
+# <pre>/<textarea> keep their whitespace verbatim.
+PRESERVE_RE = re.compile(r"(<(pre|textarea)\b.*?</\2>)", re.S | re.I)
+# HTML comments, except conditional comments that Outlook relies on.
+COMMENT_RE = re.compile(r"<!--(?!\[if|<!\[endif).*?-->", re.S)
+
+
+def minify_html(source):
+    """
+    Strip HTML comments, indentation, trailing spaces and blank lines.
+
+    Newlines are kept so inline scripts without semicolons and ``//``
+    comments stay valid; only whitespace that is never significant goes.
+    """
+    parts = PRESERVE_RE.split(source)
+    out = []
+    # split() with two groups yields [text, block, tag, text, block, tag, ...]
+    for index in range(0, len(parts), 3):
+        text = COMMENT_RE.sub("", parts[index])
+        lines = (line.strip() for line in text.splitlines())
+        out.append("\n".join(line for line in lines if line))
+        if index + 1 < len(parts):
+            out.append(parts[index + 1])
+    return "\n".join(chunk for chunk in out if chunk)
+
+
+class MinifyingMixin:
+    def get_contents(self, origin):
+        contents = super().get_contents(origin)
+        if origin.name.endswith(".html"):
+            return minify_html(contents)
+        return contents
+
+
+class FilesystemLoader(MinifyingMixin, filesystem.Loader):
+    pass
+
+
+class AppDirectoriesLoader(MinifyingMixin, app_directories.Loader):
+    pass
@@ -0,0 +1,96 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter so every measurement starts cold.
+PROBE = """
+import json, os, sys, time
+start = time.perf_counter()
+timings = {}
+
+def lap(name):
+    global start
+    now = time.perf_counter()
+    timings[name] = round((now - start) * 1000, 2)
+    start = now
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+lap("load_app")
+
+if sys.argv[1] == "warm":
+    from config.warmup import warm_up
+    timings.update({f"warm_up.{k}": v for k, v in warm_up().items()})
+    start = time.perf_counter()
+
+from django.conf import settings
+from django.test import Client
+# "testserver" is rejected unless ALLOWED_HOSTS is a wildcard.
+host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if "*" not in h), "localhost")
+client = Client(HTTP_HOST=host)
+for n, path in enumerate(sys.argv[2:], 1):
+    response = client.get(path, secure=True)
+    if response.status_code != 200:
+        sys.exit(f"GET {path} returned {response.status_code}; pass a --path that renders a page")
+    lap(f"request_{n} {path}")
+
+print(json.dumps(timings))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure cold-start time of a fresh worker process: app loading, "
+        "warm-up steps and the first requests, with and without warm-up."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="URL to request after start-up (repeatable). Default: / twice.",
+        )
+        parser.add_argument("--json", action="store_true", help="Print raw JSON.")
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or ["/", "/"]
+        report = {}
+        for mode in ("cold", "warm"):
+            runs = [self.probe(mode, paths) for _ in range(options["runs"])]
+            report[mode] = {
+                phase: round(statistics.median(run[phase] for run in runs), 2)
+                for phase in runs[0]
+            }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        for mode, phases in report.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{mode} start (median ms)"))
+            for phase, ms in phases.items():
+                self.stdout.write(f"  {phase:<32} {ms:>9.2f}")
+            self.stdout.write(f"  {'total':<32} {sum(phases.values()):>9.2f}")
+
+    def probe(self, mode, paths):
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "config.settings"
+        )}
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE, mode, *paths],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env=env,
+        )
+        if result.returncode != 0:
+            raise CommandError(result.stderr.strip())
+        return json.loads(result.stdout.strip().splitlines()[-1])
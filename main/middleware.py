@@ -0,0 +1,114 @@
+import re
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always available.
+    brotli = None
+
+COMPRESSIBLE_TYPES = {"text/html", "application/json"}
+# HTML carries CSRF tokens next to reflected input (BREACH). Brotli has no
+# length-hiding padding, so those pages always get padded gzip instead.
+BROTLI_TYPES = COMPRESSIBLE_TYPES - {"text/html"}
+re_coding = re.compile(r"^\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?", re.IGNORECASE)
+
+
+def accepts_encoding(request, coding):
+    """
+    Whether the request's Accept-Encoding allows ``coding``: listed by name
+    (or as ``*``) without ``q=0``.
+    """
+    weights = {}
+    for item in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        match = re_coding.match(item)
+        if not match:
+            continue
+        try:
+            weight = float(match[2]) if match[2] is not None else 1.0
+        except ValueError:
+            weight = 0.0
+        weights[match[1].lower()] = weight
+    return weights.get(coding, weights.get("*", 0.0)) > 0
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Brotli/gzip compression for dynamic HTML and JSON responses, streamed or
+    not. Static files are left to WhiteNoise, which serves them precompressed,
+    so this middleware sits below it in MIDDLEWARE.
+
+    Like Django's GZipMiddleware, gzip output is padded with random bytes
+    (``max_random_bytes``) to mitigate BREACH. Brotli cannot be padded that
+    way, so it is only offered for BROTLI_TYPES.
+    """
+
+    max_random_bytes = 100
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+        content_type = response.get("Content-Type", "").split(";")[0].strip()
+        if content_type not in COMPRESSIBLE_TYPES:
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if (
+            brotli is not None
+            and content_type in BROTLI_TYPES
+            and accepts_encoding(request, "br")
+        ):
+            encoding = "br"
+        elif accepts_encoding(request, "gzip"):
+            encoding = "gzip"
+        else:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                # Async streams are left alone rather than consumed here.
+                return response
+            response.streaming_content = self.compress_stream(
+                encoding, response.streaming_content
+            )
+            del response.headers["Content-Length"]
+        else:
+            compressed = self.compress(encoding, response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(response.content))
+
+        # The compressed body no longer matches a strong ETag.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def compress(self, encoding, content):
+        if encoding == "br":
+            return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+        return compress_string(content, max_random_bytes=self.max_random_bytes)
+
+    def compress_stream(self, encoding, chunks):
+        if encoding == "gzip":
+            return compress_sequence(chunks, max_random_bytes=self.max_random_bytes)
+        return self._brotli_stream(chunks)
+
+    def _brotli_stream(self, chunks):
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk)
+            if data:
+                yield data
+            # Flush per chunk so streamed output reaches the client promptly.
+            data = compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
@@ -1,3 +1,85 @@
-from django.test import TestCase
+import gzip
 
-# Create your tests here.
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from accounts.models import User
+
+from .loaders import minify_html
+from .middleware import CompressionMiddleware, brotli
+
+
+class MinifyHtmlTests(SimpleTestCase):
+    def test_strips_comments_indentation_and_blank_lines(self):
+        source = "<div>\n    <!-- note -->\n\n    <p>Hi</p>\n</div>\n"
+        self.assertEqual(minify_html(source), "<div>\n<p>Hi</p>\n</div>")
+
+    def test_keeps_preformatted_blocks_and_conditional_comments(self):
+        source = "  <textarea>\n  a\n    b</textarea>\n  <!--[if mso]>x<![endif]-->"
+        self.assertEqual(
+            minify_html(source), "<textarea>\n  a\n    b</textarea>\n<!--[if mso]>x<![endif]-->"
+        )
+
+
+class CompressionMiddlewareTests(SimpleTestCase):
+    factory = RequestFactory()
+    body = b"<p>" + b"hello world " * 100 + b"</p>"
+
+    def process(self, response, accept="gzip"):
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING=accept)
+        return CompressionMiddleware(lambda r: response).process_response(
+            request, response
+        )
+
+    def test_gzips_html(self):
+        response = self.process(HttpResponse(self.body))
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_respects_q_zero(self):
+        response = self.process(HttpResponse(self.body), accept="br;q=0, gzip;q=0")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        response = self.process(HttpResponse(self.body), accept="*;q=0.5, br;q=0")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_skips_small_and_non_html_responses(self):
+        with override_settings(COMPRESSION_MIN_SIZE=10_000):
+            self.assertFalse(self.process(HttpResponse(self.body)).has_header("Content-Encoding"))
+        css = HttpResponse(self.body, content_type="text/css")
+        self.assertFalse(self.process(css).has_header("Content-Encoding"))
+
+    def test_streams_gzip(self):
+        response = self.process(StreamingHttpResponse([self.body, self.body]))
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        compressed = b"".join(response.streaming_content)
+        self.assertEqual(gzip.decompress(compressed), self.body * 2)
+
+    def test_prefers_brotli_for_json_when_available(self):
+        if brotli is None:
+            self.skipTest("brotli is not installed")
+        json = HttpResponse(self.body, content_type="application/json")
+        response = self.process(json, accept="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), self.body)
+
+    def test_html_always_gets_padded_gzip(self):
+        response = self.process(HttpResponse(self.body), accept="br, gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        sizes = {
+            len(self.process(HttpResponse(self.body), accept="br, gzip").content)
+            for _ in range(20)
+        }
+        self.assertGreater(len(sizes), 1)  # random padding varies the length
+
+
+class DashboardPageTests(TestCase):
+    def test_dashboard_is_compressed_and_uses_static_assets(self):
+        user = User.objects.create_user(email="dash@example.com", password="pass12345")
+        self.client.force_login(user)
+        response = self.client.get(reverse("dashboard"), HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        html = gzip.decompress(response.content).decode()
+        self.assertIn("js/dashboard.js", html)
+        self.assertNotIn("DASHBOARD CHARTS", html)
@@ -0,0 +1,311 @@
+/* ============================================================
+   DASHBOARD CHARTS — Chart.js 4
+   ============================================================ */
+
+/* ── Shared defaults ─────────────────────────────────────── */
+Chart.defaults.font.family = "'Inter', system-ui, sans-serif";
+Chart.defaults.font.size   = 12;
+Chart.defaults.color       = '#94a3b8';
+Chart.defaults.plugins.legend.display = false;
+
+const BLUE   = '#2563eb';
+const BLUE_L = '#bfdbfe';
+const BLUE_T = 'rgba(37,99,235,0.12)';
+const MUTED  = '#e2e8f0';
+
+function blueGradient(ctx, area) {
+  const g = ctx.createLinearGradient(0, area.top, 0, area.bottom);
+  g.addColorStop(0, 'rgba(37,99,235,0.18)');
+  g.addColorStop(1, 'rgba(37,99,235,0)');
+  return g;
+}
+
+/* ── Sparklines ──────────────────────────────────────────── */
+function makeSparkline(id, data, color) {
+  const ctx = document.getElementById(id);
+  if (!ctx) return;
+  new Chart(ctx, {
+    type: 'line',
+    data: {
+      labels: data.map((_, i) => i),
+      datasets: [{
+        data: data,
+        borderColor: color,
+        borderWidth: 2,
+        pointRadius: 0,
+        tension: 0.45,
+        fill: true,
+        backgroundColor: (context) => {
+          const { ctx: c, chartArea } = context.chart;
+          if (!chartArea) return 'transparent';
+          const g = c.createLinearGradient(0, chartArea.top, 0, chartArea.bottom);
+          g.addColorStop(0, color + '30');
+          g.addColorStop(1, color + '00');
+          return g;
+        }
+      }]
+    },
+    options: {
+      responsive: true,
+      maintainAspectRatio: false,
+      animation: { duration: 800, easing: 'easeOutQuart' },
+      plugins: { tooltip: { enabled: false } },
+      scales: { x: { display: false }, y: { display: false } }
+    }
+  });
+}
+
+makeSparkline('spark-revenue', [28,35,30,42,38,48,44,52,46,55,49,60], '#2563eb');
+makeSparkline('spark-users',   [120,145,130,160,175,155,190,210,195,230,215,245], '#16a34a');
+makeSparkline('spark-orders',  [95,88,102,91,85,98,80,92,87,78,90,83], '#d97706');
+makeSparkline('spark-conv',    [3.1,3.4,3.2,3.6,3.5,3.7,3.5,3.8,3.6,3.9,3.7,3.68], '#7c3aed');
+
+
+/* ── Revenue Line Chart ──────────────────────────────────── */
+const revenueData = {
+  '6m': {
+    labels: ['Jul','Aug','Sep','Oct','Nov','Dec'],
+    revenue: [28400, 31200, 29800, 36500, 41200, 48295],
+    target:  [30000, 32000, 32000, 35000, 38000, 45000],
+  },
+  '1y': {
+    labels: ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'],
+    revenue: [18200,19800,21400,20100,23600,26800,28400,31200,29800,36500,41200,48295],
+    target:  [20000,21000,22000,22000,24000,26000,30000,32000,32000,35000,38000,45000],
+  },
+  'all': {
+    labels: ['2022 Q1','Q2','Q3','Q4','2023 Q1','Q2','Q3','Q4','2024 Q1','Q2','Q3','Q4'],
+    revenue: [9200,11400,13100,14800,16200,18900,22400,26100,28500,33200,38900,48295],
+    target:  [10000,12000,13000,15000,17000,20000,23000,27000,30000,34000,40000,48000],
+  }
+};
+
+let revenueChart;
+function buildRevenueChart(period) {
+  const d = revenueData[period];
+  if (revenueChart) revenueChart.destroy();
+  const ctx = document.getElementById('chart-revenue');
+  revenueChart = new Chart(ctx, {
+    type: 'line',
+    data: {
+      labels: d.labels,
+      datasets: [
+        {
+          label: 'Revenue',
+          data: d.revenue,
+          borderColor: BLUE,
+          borderWidth: 2.5,
+          pointRadius: 4,
+          pointBackgroundColor: BLUE,
+          pointHoverRadius: 6,
+          tension: 0.4,
+          fill: true,
+          backgroundColor: (context) => {
+            const { ctx: c, chartArea } = context.chart;
+            if (!chartArea) return BLUE_T;
+            return blueGradient(c, chartArea);
+          },
+          order: 1
+        },
+        {
+          label: 'Target',
+          data: d.target,
+          borderColor: BLUE_L,
+          borderWidth: 2,
+          borderDash: [6, 4],
+          pointRadius: 0,
+          tension: 0.4,
+          fill: false,
+          order: 2
+        }
+      ]
+    },
+    options: {
+      responsive: true,
+      maintainAspectRatio: false,
+      animation: { duration: 700, easing: 'easeOutQuart' },
+      interaction: { mode: 'index', intersect: false },
+      plugins: {
+        legend: { display: false },
+        tooltip: {
+          backgroundColor: '#fff',
+          borderColor: '#e2e8f0',
+          borderWidth: 1,
+          titleColor: '#0f172a',
+          bodyColor: '#64748b',
+          padding: 12,
+          callbacks: {
+            label: ctx => ` $${ctx.parsed.y.toLocaleString()}`
+          }
+        }
+      },
+      scales: {
+        x: { grid: { display: false }, border: { display: false } },
+        y: {
+          grid: { color: '#f1f5f9' },
+          border: { display: false },
+          ticks: { callback: v => '$' + (v/1000).toFixed(0) + 'k' }
+        }
+      }
+    }
+  });
+}
+buildRevenueChart('6m');
+
+function setPeriod(btn, chart, period) {
+  btn.closest('.dash-period-tabs').querySelectorAll('.dash-period-tab').forEach(b => b.classList.remove('active'));
+  btn.classList.add('active');
+  if (chart === 'revenue') buildRevenueChart(period);
+}
+
+
+/* ── Orders Bar Chart ────────────────────────────────────── */
+new Chart(document.getElementById('chart-orders'), {
+  type: 'bar',
+  data: {
+    labels: ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'],
+    datasets: [
+      {
+        label: 'Completed',
+        data: [82,95,78,101,110,98,115,127,109,134,121,118],
+        backgroundColor: BLUE,
+        borderRadius: 5,
+        borderSkipped: false,
+      },
+      {
+        label: 'Cancelled',
+        data: [12,9,14,8,11,15,10,13,18,11,9,16],
+        backgroundColor: '#fca5a5',
+        borderRadius: 5,
+        borderSkipped: false,
+      }
+    ]
+  },
+  options: {
+    responsive: true,
+    maintainAspectRatio: false,
+    animation: { duration: 700 },
+    interaction: { mode: 'index', intersect: false },
+    plugins: {
+      legend: { display: false },
+      tooltip: {
+        backgroundColor: '#fff',
+        borderColor: '#e2e8f0',
+        borderWidth: 1,
+        titleColor: '#0f172a',
+        bodyColor: '#64748b',
+        padding: 12,
+      }
+    },
+    scales: {
+      x: { grid: { display: false }, border: { display: false }, stacked: false },
+      y: { grid: { color: '#f1f5f9' }, border: { display: false }, ticks: { stepSize: 25 } }
+    }
+  }
+});
+
+
+/* ── Traffic Doughnut ────────────────────────────────────── */
+new Chart(document.getElementById('chart-traffic'), {
+  type: 'doughnut',
+  data: {
+    labels: ['Organic', 'Direct', 'Referral', 'Social', 'Email'],
+    datasets: [{
+      data: [44, 24, 16, 10, 6],
+      backgroundColor: ['#2563eb', '#60a5fa', '#93c5fd', '#a78bfa', '#34d399'],
+      borderWidth: 2,
+      borderColor: '#fff',
+      hoverOffset: 6,
+    }]
+  },
+  options: {
+    responsive: true,
+    maintainAspectRatio: false,
+    cutout: '72%',
+    animation: { duration: 800, easing: 'easeOutQuart' },
+    plugins: {
+      legend: { display: false },
+      tooltip: {
+        backgroundColor: '#fff',
+        borderColor: '#e2e8f0',
+        borderWidth: 1,
+        titleColor: '#0f172a',
+        bodyColor: '#64748b',
+        padding: 12,
+        callbacks: { label: ctx => ` ${ctx.label}: ${ctx.parsed}%` }
+      }
+    }
+  }
+});
+
+
+/* ── Sessions Area Chart ─────────────────────────────────── */
+new Chart(document.getElementById('chart-sessions'), {
+  type: 'line',
+  data: {
+    labels: ['Mon','Tue','Wed','Thu','Fri','Sat','Sun'],
+    datasets: [{
+      label: 'Sessions',
+      data: [1240, 1580, 1390, 1720, 1650, 980, 870],
+      borderColor: BLUE,
+      borderWidth: 2.5,
+      pointRadius: 3,
+      pointBackgroundColor: BLUE,
+      tension: 0.45,
+      fill: true,
+      backgroundColor: (context) => {
+        const { ctx: c, chartArea } = context.chart;
+        if (!chartArea) return BLUE_T;
+        return blueGradient(c, chartArea);
+      }
+    }]
+  },
+  options: {
+    responsive: true,
+    maintainAspectRatio: false,
+    animation: { duration: 700 },
+    interaction: { mode: 'index', intersect: false },
+    plugins: {
+      legend: { display: false },
+      tooltip: {
+        backgroundColor: '#fff',
+        borderColor: '#e2e8f0',
+        borderWidth: 1,
+        titleColor: '#0f172a',
+        bodyColor: '#64748b',
+        padding: 10,
+      }
+    },
+    scales: {
+      x: { grid: { display: false }, border: { display: false } },
+      y: { display: false }
+    }
+  }
+});
+
+
+/* ── Trend sparklines in table ───────────────────────────── */
+const trends = {
+  'trend-1': { data: [40,55,48,62,58,70,65,75], color: '#16a34a' },
+  'trend-2': { data: [60,52,65,58,70,62,68,72], color: '#2563eb' },
+  'trend-3': { data: [45,50,42,55,48,58,52,60], color: '#2563eb' },
+  'trend-4': { data: [80,72,78,68,74,65,70,62], color: '#e11d48' },
+  'trend-5': { data: [30,38,32,42,36,45,40,48], color: '#16a34a' },
+};
+Object.entries(trends).forEach(([id, { data, color }]) => {
+  const el = document.getElementById(id);
+  if (!el) return;
+  new Chart(el, {
+    type: 'line',
+    data: {
+      labels: data.map((_,i) => i),
+      datasets: [{ data, borderColor: color, borderWidth: 1.5, pointRadius: 0, tension: 0.4, fill: false }]
+    },
+    options: {
+      responsive: false,
+      animation: false,
+      plugins: { tooltip: { enabled: false } },
+      scales: { x: { display: false }, y: { display: false } }
+    }
+  });
+});